@@ -12,37 +12,95 @@ Usage:
     python fair_compliance.py --validate <paper_id>     # Validate single paper
     python fair_compliance.py --validate-all             # Validate all processed papers
     python fair_compliance.py --report                   # Generate compliance report
+    python fair_compliance.py --validate-all --workers 4 # Limit worker processes
 
 Author: Francois
 Date: 2025-11-04
 """
 
 import json
+import os
 import sys
 import argparse
 import re
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Tuple
+from types import MappingProxyType
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Set, Tuple
 from datetime import datetime
 
+from json_io import dump_json_line, load_json_file, parse_json, write_json_file
+
+
+# DOI prefix check (registrant code of 4+ digits), compiled once
+_DOI_RE = re.compile(r'10\.\d{4,}/')
+
+# Shared read-only stand-in for missing metadata sections
+_EMPTY = MappingProxyType({})
+
+# FAIR categories, each scored out of 25 points
+FAIR_CATEGORIES = ("findable", "accessible", "interoperable", "reusable")
+
+# Files every processed paper directory is expected to contain
+REQUIRED_FILES = ("metadata.json", "context.md", "annotations.md", "full_text.txt")
+
+# One presence bit per required file, set during the directory scan
+_REQUIRED_FILE_BITS = {name: 1 << i for i, name in enumerate(REQUIRED_FILES)}
+_ALL_REQUIRED_FILES = (1 << len(REQUIRED_FILES)) - 1
+
 
 class FAIRComplianceValidator:
     """Validate FAIR compliance for papers in knowledge base."""
 
-    def __init__(self, base_dir: str = None):
-        """Initialize validator."""
+    def __init__(self, base_dir: str = None, cache_master_index: bool = True):
+        """
+        Initialize validator.
+
+        Args:
+            base_dir: Base directory of the project
+            cache_master_index: Keep master-index paper_ids in a set across
+                validate_paper calls. Disable for one-off validations or when
+                master-index.json changes between calls.
+        """
         self.base_dir = Path(base_dir) if base_dir else Path.cwd()
         self.papers_dir = self.base_dir / "knowledge-base" / "papers"
+        # Plain-string form for per-paper path joins (avoids Path construction per file)
+        self._papers_path = os.fspath(self.papers_dir)
         self.index_dir = self.base_dir / "knowledge-base" / "index"
         self.ontology_dir = self.base_dir / "knowledge-base" / "ontology"
+        self.results_file = self.index_dir / "fair_compliance_results.jsonl"
+        self.cache_file = self.index_dir / "fair_cache.json"
+        self.cache_master_index = cache_master_index
+        self._master_index_ids: Optional[Set[str]] = None
+
+    def _is_indexed(self, paper_id: Optional[str]) -> bool:
+        """
+        Check whether paper_id is listed in master-index.json.
+
+        With caching, the ids are loaded into a set once; otherwise the index is
+        read fresh and scanned only until the first match.
+        """
+        if not paper_id:
+            return False
+        if self._master_index_ids is not None:
+            return paper_id in self._master_index_ids
+
+        master_index = load_json_file(self.index_dir / "master-index.json")
+        papers = master_index.get("papers", ())
+        if self.cache_master_index:
+            self._master_index_ids = {p.get("paper_id") for p in papers}
+            return paper_id in self._master_index_ids
+        return any(p.get("paper_id") == paper_id for p in papers)
 
     def validate_paper(self, paper_id: str) -> Dict:
         """
         Validate a single paper against FAIR principles.
         Returns dict with score and detailed findings.
         """
-        paper_dir = self.papers_dir / paper_id
-        if not paper_dir.exists():
+        paper_dir = os.path.join(self._papers_path, paper_id)
+        try:
+            present, file_sizes = self._scan_paper_files(paper_dir)
+        except (FileNotFoundError, NotADirectoryError):
             return {
                 "paper_id": paper_id,
                 "score": 0,
@@ -50,12 +108,22 @@ class FAIRComplianceValidator:
                 "error": f"Paper directory not found: {paper_dir}"
             }
 
+        # Load metadata once; every checker works from the same parse
+        metadata = None
+        metadata_error = None
+        try:
+            metadata = load_json_file(os.path.join(paper_dir, "metadata.json"))
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            metadata_error = str(e)
+
         results = {
             "paper_id": paper_id,
-            "findable": self._check_findable(paper_dir),
-            "accessible": self._check_accessible(paper_dir),
-            "interoperable": self._check_interoperable(paper_dir, paper_id),
-            "reusable": self._check_reusable(paper_dir)
+            "findable": self._check_findable(paper_dir, metadata, metadata_error),
+            "accessible": self._check_accessible(present, file_sizes, metadata, metadata_error),
+            "interoperable": self._check_interoperable(paper_dir, paper_id, metadata),
+            "reusable": self._check_reusable(file_sizes, metadata)
         }
 
         # Calculate total score
@@ -72,7 +140,30 @@ class FAIRComplianceValidator:
 
         return results
 
-    def _check_findable(self, paper_dir: Path) -> Dict:
+    def _scan_paper_files(self, paper_dir: str) -> Tuple[int, Dict[str, int]]:
+        """
+        Scan a paper directory once for the required files.
+
+        A single os.scandir pass replaces separate exists()/stat() calls per file.
+        Returns a presence bitmask (see _REQUIRED_FILE_BITS) and the sizes of
+        the files found. Raises FileNotFoundError if the directory does not exist.
+        """
+        present = 0
+        file_sizes = {}
+        with os.scandir(paper_dir) as entries:
+            for entry in entries:
+                bit = _REQUIRED_FILE_BITS.get(entry.name)
+                if bit is None:
+                    continue
+                try:
+                    file_sizes[entry.name] = entry.stat().st_size
+                except OSError:
+                    continue
+                present |= bit
+        return present, file_sizes
+
+    def _check_findable(self, paper_dir: str, metadata: Optional[Dict],
+                        metadata_error: Optional[str] = None) -> Dict:
         """
         Check Findable criteria (25 points max).
         - Has valid DOI or unique identifier (10 pts)
@@ -83,20 +174,14 @@ class FAIRComplianceValidator:
         issues = []
         details = {}
 
-        # Load metadata
-        metadata_file = paper_dir / "metadata.json"
-        if not metadata_file.exists():
-            return {"score": 0, "issues": ["metadata.json not found"], "details": {}}
-
-        try:
-            with open(metadata_file, 'r') as f:
-                metadata = json.load(f)
-        except Exception as e:
-            return {"score": 0, "issues": [f"Failed to read metadata: {e}"], "details": {}}
+        if metadata is None:
+            if metadata_error is None:
+                return {"score": 0, "issues": ["metadata.json not found"], "details": {}}
+            return {"score": 0, "issues": [f"Failed to read metadata: {metadata_error}"], "details": {}}
 
         # Check DOI (10 points)
         doi = metadata.get("doi", "")
-        if doi and doi != "" and re.match(r'10\.\d{4,}/', doi):
+        if doi and _DOI_RE.match(doi):
             score += 10
             details["has_valid_doi"] = True
         elif metadata.get("paper_id"):
@@ -108,29 +193,24 @@ class FAIRComplianceValidator:
             issues.append("No DOI or unique identifier")
 
         # Check indexed in master-index (5 points)
-        master_index_file = self.index_dir / "master-index.json"
-        if master_index_file.exists():
-            try:
-                with open(master_index_file, 'r') as f:
-                    master_index = json.load(f)
-                    paper_ids = [p.get("paper_id") for p in master_index.get("papers", [])]
-                    if metadata.get("paper_id") in paper_ids:
-                        score += 5
-                        details["indexed"] = True
-                    else:
-                        issues.append("Not indexed in master-index.json")
-                        details["indexed"] = False
-            except Exception as e:
-                issues.append(f"Failed to check master index: {e}")
+        try:
+            if self._is_indexed(metadata.get("paper_id")):
+                score += 5
+                details["indexed"] = True
+            else:
+                issues.append("Not indexed in master-index.json")
                 details["indexed"] = False
-        else:
+        except FileNotFoundError:
             issues.append("master-index.json not found")
             details["indexed"] = False
+        except Exception as e:
+            issues.append(f"Failed to check master index: {e}")
+            details["indexed"] = False
 
         # Check metadata completeness (10 points)
         title = metadata.get("title", "")
         authors = metadata.get("authors", [])
-        year = metadata.get("publication", {}).get("year")
+        year = (metadata.get("publication") or _EMPTY).get("year")
 
         completeness_score = 0
         if title and title != "--- Page 1 ---" and title != "":
@@ -158,7 +238,8 @@ class FAIRComplianceValidator:
 
         return {"score": score, "max_score": 25, "issues": issues, "details": details}
 
-    def _check_accessible(self, paper_dir: Path) -> Dict:
+    def _check_accessible(self, present: int, file_sizes: Dict[str, int], metadata: Optional[Dict],
+                          metadata_error: Optional[str] = None) -> Dict:
         """
         Check Accessible criteria (25 points max).
         - File paths correct (10 pts)
@@ -170,55 +251,42 @@ class FAIRComplianceValidator:
         details = {}
 
         # Check file paths (10 points)
-        required_files = ["metadata.json", "context.md", "annotations.md", "full_text.txt"]
-        existing_files = [f for f in required_files if (paper_dir / f).exists()]
-
-        if len(existing_files) == 4:
+        if present == _ALL_REQUIRED_FILES:
             score += 10
             details["all_files_exist"] = True
         else:
-            missing = set(required_files) - set(existing_files)
-            score += int(len(existing_files) / len(required_files) * 10)
+            missing = [f for f in REQUIRED_FILES if not present & _REQUIRED_FILE_BITS[f]]
+            existing_count = len(REQUIRED_FILES) - len(missing)
+            score += int(existing_count / len(REQUIRED_FILES) * 10)
             issues.append(f"Missing files: {', '.join(missing)}")
             details["all_files_exist"] = False
-            details["missing_files"] = list(missing)
-
-        # Check full_text.txt (10 points)
-        full_text_file = paper_dir / "full_text.txt"
-        if full_text_file.exists():
-            try:
-                text = full_text_file.read_text()
-                if len(text) > 1000:  # At least 1KB of text
-                    score += 10
-                    details["full_text_adequate"] = True
-                else:
-                    score += 5
-                    issues.append(f"full_text.txt is short ({len(text)} chars)")
-                    details["full_text_adequate"] = False
-            except Exception as e:
-                issues.append(f"Failed to read full_text.txt: {e}")
-                details["full_text_adequate"] = False
-        else:
+            details["missing_files"] = missing
+
+        # Check full_text.txt (10 points) - size from the directory scan, no need to read the text
+        size = file_sizes.get("full_text.txt")
+        if size is None:
             issues.append("full_text.txt not found")
             details["full_text_adequate"] = False
+        elif size > 1000:  # At least 1KB of text
+            score += 10
+            details["full_text_adequate"] = True
+        else:
+            score += 5
+            issues.append(f"full_text.txt is short ({size} bytes)")
+            details["full_text_adequate"] = False
 
-        # Check metadata.json valid (5 points) - already validated in findable
-        metadata_file = paper_dir / "metadata.json"
-        if metadata_file.exists():
-            try:
-                with open(metadata_file, 'r') as f:
-                    json.load(f)
-                score += 5
-                details["metadata_valid_json"] = True
-            except Exception as e:
-                issues.append(f"metadata.json invalid JSON: {e}")
-                details["metadata_valid_json"] = False
+        # Check metadata.json valid (5 points) - parsed once in validate_paper
+        if metadata is not None:
+            score += 5
+            details["metadata_valid_json"] = True
         else:
+            if metadata_error is not None:
+                issues.append(f"metadata.json invalid JSON: {metadata_error}")
             details["metadata_valid_json"] = False
 
         return {"score": score, "max_score": 25, "issues": issues, "details": details}
 
-    def _check_interoperable(self, paper_dir: Path, paper_id: str) -> Dict:
+    def _check_interoperable(self, paper_dir: str, paper_id: str, metadata: Optional[Dict]) -> Dict:
         """
         Check Interoperable criteria (25 points max).
         - Linked to ≥1 ontology term (10 pts)
@@ -229,16 +297,12 @@ class FAIRComplianceValidator:
         issues = []
         details = {}
 
-        # Load metadata
-        metadata_file = paper_dir / "metadata.json"
-        try:
-            with open(metadata_file, 'r') as f:
-                metadata = json.load(f)
-        except:
+        if metadata is None:
             return {"score": 0, "max_score": 25, "issues": ["Cannot read metadata"], "details": {}}
 
         # Check ontology links (10 points)
-        ontology_terms = metadata.get("interoperability", {}).get("ontology_terms", [])
+        interoperability = metadata.get("interoperability") or _EMPTY
+        ontology_terms = interoperability.get("ontology_terms") or ()
         if len(ontology_terms) >= 3:
             score += 10
             details["ontology_linked"] = True
@@ -258,14 +322,15 @@ class FAIRComplianceValidator:
 
         # DOI format
         doi = metadata.get("doi", "")
-        if doi and re.match(r'10\.\d{4,}/', doi):
+        if doi and _DOI_RE.match(doi):
             notation_score += 5
             details["uses_doi_format"] = True
         else:
             details["uses_doi_format"] = False
 
         # Check for standard units in research context
-        mag_field = metadata.get("research_context", {}).get("magnetic_field_parameters", {})
+        research_context = metadata.get("research_context") or _EMPTY
+        mag_field = research_context.get("magnetic_field_parameters") or _EMPTY
         if mag_field.get("field_strength") or mag_field.get("frequency"):
             notation_score += 5
             details["uses_standard_units"] = True
@@ -275,34 +340,38 @@ class FAIRComplianceValidator:
         score += notation_score
 
         # Check context.md follows template (5 points)
-        context_file = paper_dir / "context.md"
-        if context_file.exists():
-            try:
-                context = context_file.read_text()
-                # Check for expected sections
-                has_header = "# Paper Context:" in context or "# Context:" in context
-                has_doi = "DOI:" in context or "doi:" in context
-
-                if has_header and len(context) > 200:
-                    score += 5
-                    details["context_follows_template"] = True
-                elif has_header or has_doi:
-                    score += 3
-                    details["context_follows_template"] = "partial"
-                    issues.append("context.md partially follows template")
-                else:
-                    issues.append("context.md does not follow template")
-                    details["context_follows_template"] = False
-            except Exception as e:
-                issues.append(f"Failed to read context.md: {e}")
-                details["context_follows_template"] = False
-        else:
+        # Markers are ASCII, so search the raw bytes without decoding
+        try:
+            with open(os.path.join(paper_dir, "context.md"), 'rb') as f:
+                context = f.read()
+        except FileNotFoundError:
+            context = None
             issues.append("context.md not found")
             details["context_follows_template"] = False
+        except Exception as e:
+            context = None
+            issues.append(f"Failed to read context.md: {e}")
+            details["context_follows_template"] = False
+
+        if context is not None:
+            # Check for expected sections
+            has_header = b"# Paper Context:" in context or b"# Context:" in context
+            has_doi = b"DOI:" in context or b"doi:" in context
+
+            if has_header and len(context) > 200:
+                score += 5
+                details["context_follows_template"] = True
+            elif has_header or has_doi:
+                score += 3
+                details["context_follows_template"] = "partial"
+                issues.append("context.md partially follows template")
+            else:
+                issues.append("context.md does not follow template")
+                details["context_follows_template"] = False
 
         return {"score": score, "max_score": 25, "issues": issues, "details": details}
 
-    def _check_reusable(self, paper_dir: Path) -> Dict:
+    def _check_reusable(self, file_sizes: Dict[str, int], metadata: Optional[Dict]) -> Dict:
         """
         Check Reusable criteria (25 points max).
         - Annotations.md exists (5 pts)
@@ -313,38 +382,28 @@ class FAIRComplianceValidator:
         issues = []
         details = {}
 
-        # Load metadata
-        metadata_file = paper_dir / "metadata.json"
-        try:
-            with open(metadata_file, 'r') as f:
-                metadata = json.load(f)
-        except:
+        if metadata is None:
             return {"score": 0, "max_score": 25, "issues": ["Cannot read metadata"], "details": {}}
 
         # Check annotations.md (5 points)
-        annotations_file = paper_dir / "annotations.md"
-        if annotations_file.exists():
-            try:
-                content = annotations_file.read_text()
-                if len(content) > 100:  # Has some content
-                    score += 5
-                    details["has_annotations"] = True
-                else:
-                    score += 2
-                    details["has_annotations"] = "minimal"
-            except:
-                issues.append("Failed to read annotations.md")
-                details["has_annotations"] = False
-        else:
+        annotations_size = file_sizes.get("annotations.md")
+        if annotations_size is None:
             issues.append("annotations.md not found")
             details["has_annotations"] = False
+        elif annotations_size > 100:  # Has some content
+            score += 5
+            details["has_annotations"] = True
+        else:
+            score += 2
+            details["has_annotations"] = "minimal"
 
         # Check research context populated (10 points)
-        research_context = metadata.get("research_context", {})
+        research_context = metadata.get("research_context") or _EMPTY
+        mag_field = research_context.get("magnetic_field_parameters") or _EMPTY
         populated_fields = sum([
             bool(research_context.get("species_studied")),
             bool(research_context.get("proteins")),
-            bool(research_context.get("magnetic_field_parameters", {}).get("field_strength")),
+            bool(mag_field.get("field_strength")),
             bool(research_context.get("experimental_techniques")),
             bool(research_context.get("computational_methods")),
             bool(research_context.get("key_findings"))
@@ -358,8 +417,9 @@ class FAIRComplianceValidator:
             issues.append(f"Research context under-populated ({populated_fields}/6 fields)")
 
         # Check license/access info (10 points)
-        access_info = metadata.get("access", {})
-        has_license = access_info.get("license") and access_info.get("license") != "Unknown"
+        access_info = metadata.get("access") or _EMPTY
+        license_info = access_info.get("license")
+        has_license = license_info and license_info != "Unknown"
         has_access_level = access_info.get("access_level")
         has_original_file = access_info.get("original_file")
 
@@ -381,37 +441,166 @@ class FAIRComplianceValidator:
 
         return {"score": score, "max_score": 25, "issues": issues, "details": details}
 
-    def validate_all_papers(self) -> List[Dict]:
-        """Validate all processed papers."""
+    def _paper_signature(self, paper_id: str, master_index_mtime: Optional[int]) -> Optional[List]:
+        """
+        Modification signature of everything a paper's score depends on.
+
+        Returns mtimes (ns) of the required files, in REQUIRED_FILES order with
+        None for missing files, followed by the master-index.json mtime.
+        Returns None if the paper directory cannot be scanned.
+        """
+        mtimes = dict.fromkeys(REQUIRED_FILES)
+        try:
+            with os.scandir(os.path.join(self._papers_path, paper_id)) as entries:
+                for entry in entries:
+                    if entry.name in mtimes:
+                        mtimes[entry.name] = entry.stat().st_mtime_ns
+        except OSError:
+            return None
+        return [mtimes[name] for name in REQUIRED_FILES] + [master_index_mtime]
+
+    def _load_validation_cache(self) -> Dict:
+        """Load fair_cache.json (paper_id -> {signature, result}); empty if absent or unreadable."""
+        try:
+            return load_json_file(self.cache_file)
+        except Exception:
+            return {}
+
+    def validate_all_papers(self, max_workers: Optional[int] = None,
+                            collect: bool = True, use_cache: bool = True) -> List[Dict]:
+        """
+        Validate all processed papers.
+
+        Papers are independent, so validation is spread across a process pool
+        (max_workers defaults to os.cpu_count()). Each result is streamed to
+        fair_compliance_results.jsonl as it arrives; with collect=False the
+        results are not also kept in memory and an empty list is returned.
+
+        With use_cache, papers whose files (and master-index.json) are unchanged
+        since the last run reuse their result from fair_cache.json.
+        """
         if not self.papers_dir.exists():
             print(f"Error: Papers directory not found: {self.papers_dir}")
+            # Drop results from an earlier run so they are not reported
+            self.results_file.unlink(missing_ok=True)
             return []
 
-        paper_ids = [
-            d.name for d in self.papers_dir.iterdir()
-            if d.is_dir() and not d.name.startswith('TEMPLATE')
+        # Re-read master-index.json once at the start of each run
+        self._master_index_ids = None
+
+        with os.scandir(self.papers_dir) as entries:
+            paper_ids = [
+                entry.name for entry in entries
+                if entry.is_dir() and not entry.name.startswith('TEMPLATE')
+            ]
+
+        # Work out which papers changed since the cached run
+        cache = self._load_validation_cache() if use_cache else {}
+        try:
+            master_index_mtime = os.stat(self.index_dir / "master-index.json").st_mtime_ns
+        except OSError:
+            master_index_mtime = None
+        signatures = {
+            paper_id: self._paper_signature(paper_id, master_index_mtime)
+            for paper_id in paper_ids
+        }
+        stale = [
+            paper_id for paper_id in paper_ids
+            if signatures[paper_id] is None
+            or (cache.get(paper_id) or _EMPTY).get("signature") != signatures[paper_id]
         ]
 
-        print(f"Validating {len(paper_ids)} papers...")
+        stale_ids = set(stale)
+
+        print(f"Validating {len(paper_ids)} papers ({len(paper_ids) - len(stale)} unchanged)...")
         results = []
+        updated_cache = {}
+
+        self.index_dir.mkdir(parents=True, exist_ok=True)
+        executor = None
+        if stale:
+            executor = ProcessPoolExecutor(max_workers=max_workers or os.cpu_count(),
+                                           initializer=_init_worker,
+                                           initargs=(str(self.base_dir),))
+        try:
+            validated = executor.map(_validate_one, stale, chunksize=8) if executor else iter(())
+            with open(self.results_file, 'wb') as results_out:
+                for i, paper_id in enumerate(paper_ids, 1):
+                    print(f"  [{i}/{len(paper_ids)}] {paper_id}...", end=" ")
+                    cached = paper_id not in stale_ids
+                    result = cache[paper_id]["result"] if cached else next(validated)
+                    if result.get("valid"):
+                        print(f"{result['score']}/100" + (" (cached)" if cached else ""))
+                        results_out.write(dump_json_line(result))
+                        updated_cache[paper_id] = {
+                            "signature": signatures[paper_id],
+                            "result": result
+                        }
+                        if collect:
+                            results.append(result)
+                    else:
+                        print(f"FAILED: {result.get('error')}")
+        finally:
+            if executor:
+                executor.shutdown()
 
-        for i, paper_id in enumerate(paper_ids, 1):
-            print(f"  [{i}/{len(paper_ids)}] {paper_id}...", end=" ")
-            result = self.validate_paper(paper_id)
-            if result.get("valid"):
-                print(f"{result['score']}/100")
-                results.append(result)
-            else:
-                print(f"FAILED: {result.get('error')}")
+        if use_cache:
+            write_json_file(self.cache_file, updated_cache, indent=False)
 
         return results
 
-    def generate_report(self, results: List[Dict] = None):
-        """Generate compliance report."""
+    def iter_results(self) -> Iterator[Dict]:
+        """Yield per-paper results from the last validate_all_papers run, one at a time."""
+        if not self.results_file.exists():
+            return
+        with open(self.results_file, 'rb') as f:
+            for line in f:
+                if line.strip():
+                    yield parse_json(line)
+
+    def generate_report(self, results: Optional[Iterable[Dict]] = None):
+        """
+        Generate compliance report.
+
+        Results may be any iterable; without one, all papers are validated and
+        the report is aggregated by streaming fair_compliance_results.jsonl.
+        """
         if results is None:
-            results = self.validate_all_papers()
+            self.validate_all_papers(collect=False)
+            results = self.iter_results()
+
+        # Aggregate totals, range, distribution and category sums in one pass.
+        # Only the score, id and top issues of low scorers are kept.
+        count = 0
+        total_score = 0
+        min_score = max_score = None
+        excellent = good = needs_work = 0
+        category_totals = dict.fromkeys(FAIR_CATEGORIES, 0)
+        low_scorers = []
+
+        for r in results:
+            score = r["score"]
+            count += 1
+            total_score += score
+            if min_score is None or score < min_score:
+                min_score = score
+            if max_score is None or score > max_score:
+                max_score = score
+
+            if score >= 90:
+                excellent += 1
+            elif score >= 70:
+                good += 1
+            else:
+                needs_work += 1
+                all_issues = [issue for category in FAIR_CATEGORIES
+                              for issue in r[category]["issues"]]
+                low_scorers.append((score, r["paper_id"], all_issues[:2]))
+
+            for category in FAIR_CATEGORIES:
+                category_totals[category] += r[category]["score"]
 
-        if not results:
+        if not count:
             print("No results to report")
             return
 
@@ -420,70 +609,75 @@ class FAIRComplianceValidator:
         print("=" * 80)
 
         # Overall statistics
-        scores = [r["score"] for r in results]
-        avg_score = sum(scores) / len(scores)
-        print(f"\nPapers Validated: {len(results)}")
+        avg_score = total_score / count
+        print(f"\nPapers Validated: {count}")
         print(f"Average Score: {avg_score:.1f}/100")
-        print(f"Range: {min(scores):.1f} - {max(scores):.1f}")
+        print(f"Range: {min_score:.1f} - {max_score:.1f}")
 
         # Score distribution
-        excellent = sum(1 for s in scores if s >= 90)
-        good = sum(1 for s in scores if 70 <= s < 90)
-        needs_work = sum(1 for s in scores if s < 70)
-
         print(f"\nScore Distribution:")
-        print(f"  Excellent (≥90): {excellent} ({excellent/len(results)*100:.1f}%)")
-        print(f"  Good (70-89):    {good} ({good/len(results)*100:.1f}%)")
-        print(f"  Needs Work (<70): {needs_work} ({needs_work/len(results)*100:.1f}%)")
+        print(f"  Excellent (≥90): {excellent} ({excellent/count*100:.1f}%)")
+        print(f"  Good (70-89):    {good} ({good/count*100:.1f}%)")
+        print(f"  Needs Work (<70): {needs_work} ({needs_work/count*100:.1f}%)")
 
         # Category breakdown
-        findable = [r["findable"]["score"] for r in results]
-        accessible = [r["accessible"]["score"] for r in results]
-        interoperable = [r["interoperable"]["score"] for r in results]
-        reusable = [r["reusable"]["score"] for r in results]
-
         print(f"\nFAIR Category Averages:")
-        print(f"  Findable:       {sum(findable)/len(findable):.1f}/25")
-        print(f"  Accessible:     {sum(accessible)/len(accessible):.1f}/25")
-        print(f"  Interoperable:  {sum(interoperable)/len(interoperable):.1f}/25")
-        print(f"  Reusable:       {sum(reusable)/len(reusable):.1f}/25")
+        for category in FAIR_CATEGORIES:
+            label = f"{category.capitalize()}:"
+            print(f"  {label:15s} {category_totals[category]/count:.1f}/25")
 
         # Papers needing attention
-        low_scorers = sorted([r for r in results if r["score"] < 70],
-                            key=lambda x: x["score"])
+        low_scorers.sort(key=lambda x: x[0])
 
         if low_scorers:
             print(f"\nPapers Needing Attention ({len(low_scorers)}):")
-            for r in low_scorers[:10]:  # Show top 10
-                print(f"  {r['paper_id']:40s} {r['score']:5.1f}/100")
+            for score, paper_id, top_issues in low_scorers[:10]:  # Show top 10
+                print(f"  {paper_id:40s} {score:5.1f}/100")
                 # Show top issues
-                all_issues = (r["findable"]["issues"] + r["accessible"]["issues"] +
-                             r["interoperable"]["issues"] + r["reusable"]["issues"])
-                for issue in all_issues[:2]:
+                for issue in top_issues:
                     print(f"    • {issue}")
 
         print("=" * 80 + "\n")
 
-        # Save report
+        # Save summary report; per-paper results live in the JSONL file
         report_file = self.index_dir / "fair_compliance_report.json"
-        with open(report_file, 'w') as f:
-            json.dump({
-                "timestamp": datetime.now().isoformat(),
-                "summary": {
-                    "total_papers": len(results),
-                    "average_score": avg_score,
-                    "score_distribution": {
-                        "excellent": excellent,
-                        "good": good,
-                        "needs_work": needs_work
-                    }
-                },
-                "results": results
-            }, f, indent=2, ensure_ascii=False)
+        write_json_file(report_file, {
+            "timestamp": datetime.now().isoformat(),
+            "summary": {
+                "total_papers": count,
+                "average_score": avg_score,
+                "score_distribution": {
+                    "excellent": excellent,
+                    "good": good,
+                    "needs_work": needs_work
+                }
+            },
+            "results_file": self.results_file.name
+        })
 
         print(f"✓ Saved report to {report_file}")
 
 
+# Per-process validate_paper, bound once by _init_worker for validate_all_papers
+_worker_validate: Optional[Callable[[str], Dict]] = None
+
+
+def _init_worker(base_dir: str):
+    """
+    Set up a validator per worker process.
+
+    The validator (and its cached master-index ids) lives for the whole pool,
+    and its validate_paper is bound once so per-paper calls skip the lookup.
+    """
+    global _worker_validate
+    _worker_validate = FAIRComplianceValidator(base_dir=base_dir).validate_paper
+
+
+def _validate_one(paper_id: str) -> Dict:
+    """Validate a single paper inside a worker process."""
+    return _worker_validate(paper_id)
+
+
 def main():
     """Command-line interface."""
     parser = argparse.ArgumentParser(
@@ -495,20 +689,27 @@ def main():
                        help="Validate all processed papers")
     parser.add_argument("--report", action="store_true",
                        help="Generate compliance report")
+    parser.add_argument("--no-cache", action="store_true",
+                       help="Revalidate every paper, ignoring fair_cache.json")
+    parser.add_argument("--workers", type=int, default=None,
+                       help="Worker processes for --validate-all (default: CPU count)")
     parser.add_argument("--base-dir", help="Base directory of project",
                        default="/Users/clarice/Desktop/Claude test")
 
     args = parser.parse_args()
 
-    validator = FAIRComplianceValidator(base_dir=args.base_dir)
+    # A single --validate reads master-index.json once, so skip building the id set
+    validator = FAIRComplianceValidator(base_dir=args.base_dir,
+                                        cache_master_index=not args.validate)
 
     if args.validate:
         result = validator.validate_paper(args.validate)
         print(json.dumps(result, indent=2))
     elif args.validate_all or args.report:
-        results = validator.validate_all_papers()
+        validator.validate_all_papers(max_workers=args.workers, collect=False,
+                                      use_cache=not args.no_cache)
         if args.report:
-            validator.generate_report(results)
+            validator.generate_report(validator.iter_results())
     else:
         parser.print_help()
 
@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""
+JSON I/O helpers shared by the knowledge base scripts.
+
+orjson is used when it is installed, with the json module as fallback. Both
+backends produce the same JSON; only the speed differs.
+
+Author: Research Knowledge Base System
+Date: 2025-11-04
+"""
+
+import os
+import json
+from pathlib import Path
+from typing import Any, Union
+
+# Optional fast JSON backend with stdlib fallback
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+
+def parse_json(data: Union[bytes, str]) -> Any:
+    """Parse a JSON document (bytes or str), using orjson when it is installed."""
+    return orjson.loads(data) if HAS_ORJSON else json.loads(data)
+
+
+def dump_json(obj: Any, indent: bool = False) -> bytes:
+    """
+    Serialize an object as UTF-8 JSON.
+
+    Values JSON cannot represent are written as their str(). Text orjson
+    rejects (e.g. lone surrogates) is written by the json module, with
+    non-ASCII characters escaped if they cannot be encoded.
+
+    Args:
+        obj: Object to serialize
+        indent: Pretty-print with 2-space indentation (default: compact)
+
+    Returns:
+        Encoded JSON document
+    """
+    if HAS_ORJSON:
+        option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if indent else 0)
+        try:
+            return orjson.dumps(obj, option=option, default=str)
+        except orjson.JSONEncodeError:
+            pass
+
+    layout = {"indent": 2} if indent else {"separators": (",", ":")}
+    try:
+        return json.dumps(obj, ensure_ascii=False, default=str, **layout).encode('utf-8')
+    except UnicodeEncodeError:
+        return json.dumps(obj, ensure_ascii=True, default=str, **layout).encode('ascii')
+
+
+def dump_json_line(obj: Any) -> bytes:
+    """Serialize an object as one compact JSON line (JSONL record), newline included."""
+    return dump_json(obj) + b"\n"
+
+
+def load_json_file(path: Union[str, Path]) -> Any:
+    """Parse a JSON file, read as bytes in a single read."""
+    with open(path, 'rb') as f:
+        return parse_json(f.read())
+
+
+def write_json_file(path: Union[str, Path], obj: Any, indent: bool = True):
+    """
+    Write an object as UTF-8 JSON.
+
+    The document is serialized in memory, written with a single write() to a
+    temporary file and renamed over path, so readers never see a partial file.
+
+    Args:
+        path: Output file path
+        obj: Object to serialize
+        indent: Pretty-print with 2-space indentation (default: True)
+    """
+    path = Path(path)
+    data = dump_json(obj, indent)
+    tmp_path = path.with_name(path.name + ".tmp")
+    with open(tmp_path, 'wb') as f:
+        f.write(data)
+    os.replace(tmp_path, path)
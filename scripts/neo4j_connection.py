@@ -22,6 +22,27 @@ from pathlib import Path
 from typing import Dict, Optional
 
 
+# All database statistics in a single round trip (one subquery per statistic)
+DATABASE_INFO_QUERY = """
+CALL { MATCH (n) RETURN count(n) AS node_count }
+CALL { MATCH ()-[r]->() RETURN count(r) AS rel_count }
+CALL { CALL db.labels() YIELD label RETURN collect(label) AS labels }
+CALL {
+    CALL db.relationshipTypes() YIELD relationshipType
+    RETURN collect(relationshipType) AS relationship_types
+}
+RETURN node_count, rel_count, labels, relationship_types
+"""
+
+# Delete at most $batch_size nodes per transaction to bound server memory
+CLEAR_BATCH_QUERY = """
+MATCH (n)
+WITH n LIMIT $batch_size
+DETACH DELETE n
+RETURN count(*) AS deleted
+"""
+
+
 def load_neo4j_credentials(creds_file: str = None) -> Dict[str, str]:
     """
     Load Neo4j credentials from neocreds.txt.
@@ -42,15 +63,15 @@ def load_neo4j_credentials(creds_file: str = None) -> Dict[str, str]:
     if not creds_file.exists():
         raise FileNotFoundError(f"Credentials file not found: {creds_file}")
 
-    creds = {}
-    with open(creds_file, 'r') as f:
-        for line in f:
-            line = line.strip()
-            if '=' in line and not line.startswith('#'):
-                key, value = line.split('=', 1)
-                # Convert NEO4J_URI to uri, etc.
-                clean_key = key.replace('NEO4J_', '').lower()
-                creds[clean_key] = value
+    lines = (line.strip() for line in creds_file.read_text().splitlines())
+    # Convert NEO4J_URI to uri, etc.
+    creds = {
+        key.replace('NEO4J_', '').lower(): value
+        for key, value in (
+            line.split('=', 1) for line in lines
+            if '=' in line and not line.startswith('#')
+        )
+    }
 
     # Validate required fields
     required = ['uri', 'username', 'password', 'database']
@@ -64,6 +85,29 @@ def load_neo4j_credentials(creds_file: str = None) -> Dict[str, str]:
 class Neo4jConnection:
     """Neo4j connection manager."""
 
+    # Shared instances by resolved credentials file (see shared())
+    _shared: Dict[str, "Neo4jConnection"] = {}
+
+    @classmethod
+    def shared(cls, creds_file: str = None) -> "Neo4jConnection":
+        """
+        Get the process-wide connection for a credentials file.
+
+        Drivers are expensive to open (TLS handshake, routing table fetch), so
+        callers that run several operations should share one instead of
+        creating a connection per operation.
+
+        Args:
+            creds_file: Path to credentials file (default: neocreds.txt)
+
+        Returns:
+            Shared Neo4jConnection for that credentials file
+        """
+        key = str(Path(creds_file).resolve()) if creds_file else ""
+        if key not in cls._shared:
+            cls._shared[key] = cls(creds_file=creds_file)
+        return cls._shared[key]
+
     def __init__(self, creds_file: str = None):
         """
         Initialize Neo4j connection.
@@ -76,7 +120,10 @@ class Neo4jConnection:
         self._connected = False
 
     def connect(self):
-        """Establish connection to Neo4j."""
+        """Establish connection to Neo4j (no-op if already connected)."""
+        if self._connected:
+            return
+
         try:
             from neo4j import GraphDatabase
         except ImportError:
@@ -95,6 +142,24 @@ class Neo4jConnection:
             print(f"✗ Failed to connect to Neo4j: {e}")
             raise
 
+        self._log_wire_info()
+
+    def _log_wire_info(self):
+        """Print the negotiated Bolt version, encryption and serializer in use."""
+        try:
+            from importlib.metadata import PackageNotFoundError, version
+            try:
+                version("neo4j-rust-ext")
+                serializer = "Rust (neo4j-rust-ext)"
+            except PackageNotFoundError:
+                serializer = "pure Python (pip install neo4j-rust-ext for faster ingest)"
+
+            server = self.driver.get_server_info()
+            bolt = ".".join(str(v) for v in server.protocol_version)
+            print(f"  Bolt {bolt}, encrypted: {self.driver.encrypted}, serializer: {serializer}")
+        except Exception as e:
+            print(f"  (could not read connection details: {e})")
+
     def test_connection(self) -> bool:
         """
         Test Neo4j connection.
@@ -150,35 +215,28 @@ class Neo4jConnection:
         if not self._connected:
             self.connect()
 
-        info = {}
-
         with self.get_session() as session:
-            # Count nodes
-            result = session.run("MATCH (n) RETURN count(n) AS node_count")
-            info['node_count'] = result.single()["node_count"]
-
-            # Count relationships
-            result = session.run("MATCH ()-[r]->() RETURN count(r) AS rel_count")
-            info['relationship_count'] = result.single()["rel_count"]
-
-            # Get node labels
-            result = session.run("CALL db.labels()")
-            info['labels'] = [record["label"] for record in result]
+            record = session.run(DATABASE_INFO_QUERY).single()
 
-            # Get relationship types
-            result = session.run("CALL db.relationshipTypes()")
-            info['relationship_types'] = [record["relationshipType"] for record in result]
+        return {
+            'node_count': record["node_count"],
+            'relationship_count': record["rel_count"],
+            'labels': list(record["labels"]),
+            'relationship_types': list(record["relationship_types"])
+        }
 
-        return info
-
-    def clear_database(self, confirm: bool = False):
+    def clear_database(self, confirm: bool = False, batch_size: int = 10000):
         """
         Clear all nodes and relationships from database.
 
+        Nodes are deleted in batches of batch_size, one transaction each,
+        so large graphs do not have to fit in a single transaction.
+
         WARNING: This is destructive and cannot be undone!
 
         Args:
             confirm: Must be True to actually clear the database
+            batch_size: Maximum nodes deleted per transaction
         """
         if not confirm:
             print("⚠️  WARNING: This will delete ALL data from the database!")
@@ -190,11 +248,17 @@ class Neo4jConnection:
 
         print("Clearing database...")
 
+        total_deleted = 0
         with self.get_session() as session:
-            # Delete all nodes and relationships
-            session.run("MATCH (n) DETACH DELETE n")
-
-        print("✓ Database cleared")
+            # Delete all nodes and relationships, one bounded batch at a time
+            while True:
+                deleted = session.run(CLEAR_BATCH_QUERY, batch_size=batch_size).single()["deleted"]
+                if deleted == 0:
+                    break
+                total_deleted += deleted
+                print(f"  Deleted {total_deleted} nodes...")
+
+        print(f"✓ Database cleared ({total_deleted} nodes deleted)")
         return True
 
     def __enter__(self):
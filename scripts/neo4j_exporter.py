@@ -9,42 +9,403 @@ Usage:
     python neo4j_exporter.py --test-connection
     python neo4j_exporter.py --preview-full
     python neo4j_exporter.py --export-full
+    python neo4j_exporter.py --export-full-bulk --bulk-dir neo4j-import
+    python neo4j_exporter.py --export-full-bulk --write-only --database neo4j
     python neo4j_exporter.py --preview-subgraph --categories mechanisms,proteins
     python neo4j_exporter.py --export-subgraph --paper-ids nchem_2447,annurev...
     python neo4j_exporter.py --clear-graph --confirm
+    python neo4j_exporter.py --daemon   # read commands from stdin on one connection
 
 Author: Francois
 Date: 2025-11-04
 """
 
-import json
+import csv
+import heapq
+import shlex
 import sys
 import argparse
+import subprocess
 from pathlib import Path
 from typing import Dict, List, Set, Tuple, Optional
-from collections import defaultdict
-
+from collections import Counter, defaultdict
+from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from operator import itemgetter
+
+try:
+    import ijson
+    HAS_IJSON = True
+except ImportError:
+    HAS_IJSON = False
+
+from json_io import load_json_file
 from neo4j_connection import Neo4jConnection
 from neo4j_schema import (
+    ONTOLOGY_CATEGORY_MAPPING,
     get_node_type_for_category,
     get_relationship_type_for_predicate,
+    create_constraints,
     create_indexes
 )
 
 
-class Neo4jExporter:
-    """Export knowledge base to Neo4j graph database."""
+# Rows sent per UNWIND query; each batch is committed as one managed transaction
+BATCH_SIZE = 1000
+
+PAPER_MERGE_QUERY = """
+UNWIND $rows AS row
+MERGE (p:Paper {paper_id: row.paper_id})
+SET p += row.props
+"""
+
+# Term nodes of every label in one query (requires the APOC plugin);
+# the label is a parameter, so a single cached plan serves all node types
+APOC_TERM_MERGE_QUERY = """
+UNWIND $rows AS row
+CALL apoc.merge.node([row.label], {name: row.name}, row.props, row.props) YIELD node
+RETURN count(node)
+"""
+
+# Term MERGE query per node type, built once. Labels cannot be parameterized,
+# so each node type has its own query text; "Term" is the fallback type.
+TERM_MERGE_QUERIES = {
+    node_type: f"""
+UNWIND $rows AS row
+MERGE (n:{node_type} {{name: row.name}})
+SET n += row.props
+"""
+    for node_type in {*ONTOLOGY_CATEGORY_MAPPING.values(), "Term"}
+}
+
+
+def _endpoint(label: Optional[str]) -> str:
+    """Label suffix for a relationship endpoint pattern (empty if unknown)."""
+    return f":{label}" if label else ""
+
+
+@lru_cache(maxsize=None)
+def relationship_merge_query(subj_label: Optional[str], obj_label: Optional[str],
+                             rel_type: str) -> str:
+    """
+    Get the relationship MERGE query for an endpoint label pair and type.
+
+    Labels and relationship types cannot be parameterized, so they are part
+    of the query text; unknown endpoint labels (None) match on name only.
+    Each combination's text is built once and reused.
+    """
+    return f"""
+UNWIND $rows AS r
+MATCH (a{_endpoint(subj_label)} {{name: r.s}})
+MATCH (b{_endpoint(obj_label)} {{name: r.o}})
+MERGE (a)-[x:{rel_type}]->(b)
+SET x += r.props
+"""
+
+
+@lru_cache(maxsize=None)
+def apoc_relationship_merge_query(subj_label: Optional[str], obj_label: Optional[str]) -> str:
+    """Get the apoc.merge.relationship query for an endpoint label pair (type per row)."""
+    return f"""
+UNWIND $rows AS r
+MATCH (a{_endpoint(subj_label)} {{name: r.s}})
+MATCH (b{_endpoint(obj_label)} {{name: r.o}})
+CALL apoc.merge.relationship(a, r.type, {{}}, r.props, b, r.props) YIELD rel
+RETURN count(rel)
+"""
+
+
+# Papers and ontology categories listed by preview_export
+PREVIEW_LIMIT = 10
+
+# Concurrent sessions used for batch writes (the driver pools connections)
+DEFAULT_MAX_WORKERS = 8
+
+# Separator for array values in bulk-import CSVs (passed to neo4j-admin)
+ARRAY_DELIMITER = "|"
+
+# Database named in the printed import command when only writing CSVs
+# without credentials (Neo4j's default database)
+DEFAULT_DATABASE = "neo4j"
+
+
+def paper_properties(paper: Dict) -> Dict:
+    """
+    Build the Paper node properties (other than paper_id) for a master-index entry.
+
+    Args:
+        paper: Paper dictionary from master-index.json
+
+    Returns:
+        Dictionary of node properties
+    """
+    return {
+        "doi": paper.get("doi", ""),
+        "title": paper.get("title", ""),
+        "authors": paper.get("authors", []),
+        "year": paper.get("year"),
+        "date_added": paper.get("date_added", "")
+    }
+
+
+def term_properties(term_id: str, term_data: Dict) -> Dict:
+    """
+    Build the node properties for an ontology term.
+
+    Args:
+        term_id: Term identifier (stored as the node name)
+        term_data: Term dictionary from terms.json
+
+    Returns:
+        Dictionary of node properties
+    """
+    props = {
+        "name": term_id,
+        "definition": term_data.get("definition", ""),
+        "source": term_data.get("source", "")
+    }
+
+    # Add synonyms if present
+    if "synonyms" in term_data:
+        props["synonyms"] = term_data["synonyms"]
+
+    # Add category-specific properties
+    if "variants" in term_data:
+        props["variants"] = term_data["variants"]
+    if "organisms" in term_data:
+        props["organisms"] = term_data["organisms"]
+    if "radical_forms" in term_data:
+        props["radical_forms"] = term_data["radical_forms"]
+    if "typical_values" in term_data:
+        props["typical_values"] = term_data["typical_values"]
+    if "applications" in term_data:
+        props["applications"] = term_data["applications"]
+
+    return props
+
+
+class BulkCSVWriter:
+    """
+    Write the knowledge graph as CSV files for `neo4j-admin database import full`.
+
+    Produces papers.csv, one node file per node type and one relationship file
+    per relationship type and endpoint label pair, with header rows in the
+    admin-import format (name:ID(Label), :START_ID(Label), :END_ID(Label)).
+    Node keys are deduplicated and properties merged the same way the Bolt
+    exporter's MERGE ... SET += does.
+    """
+
+    def __init__(self, output_dir: Path):
+        """
+        Initialize writer.
 
-    def __init__(self, base_dir: str = None, creds_file: str = None):
-        """Initialize exporter."""
+        Args:
+            output_dir: Directory the CSV files are written to
+        """
+        self.output_dir = Path(output_dir).resolve()
+        self.node_files: List[Tuple[str, Path]] = []
+        self.relationship_files: List[Tuple[str, Path]] = []
+
+    @staticmethod
+    def _column_type(values: List) -> str:
+        """Return the admin-import type suffix for a property's values."""
+        present = [v for v in values if v is not None]
+        if any(isinstance(v, list) for v in present):
+            return ":string[]"
+        if present and all(isinstance(v, int) and not isinstance(v, bool) for v in present):
+            return ":int"
+        return ""
+
+    @staticmethod
+    def _format_value(value) -> str:
+        """Format a property value as a CSV field (empty means no property)."""
+        if value is None:
+            return ""
+        if isinstance(value, list):
+            return ARRAY_DELIMITER.join(str(v) for v in value)
+        return str(value)
+
+    def _write_csv(self, filename: str, id_columns: List[str],
+                   rows: List[Tuple[List[str], Dict]]) -> Path:
+        """
+        Write one CSV file with typed property columns.
+
+        Args:
+            filename: File name inside output_dir
+            id_columns: Header entries for the leading ID columns
+            rows: (id values, properties) pairs
+
+        Returns:
+            Path of the written file
+        """
+        keys = []
+        for _, props in rows:
+            keys.extend(k for k in props if k not in keys)
+
+        header = id_columns + [
+            key + self._column_type([props.get(key) for _, props in rows])
+            for key in keys
+        ]
+
+        path = self.output_dir / filename
+        with open(path, 'w', newline='', encoding='utf-8') as f:
+            writer = csv.writer(f)
+            writer.writerow(header)
+            for ids, props in rows:
+                writer.writerow(ids + [self._format_value(props.get(key)) for key in keys])
+
+        return path
+
+    def write_papers(self, papers: List[Dict]) -> int:
+        """Write papers.csv and return the number of Paper nodes."""
+        nodes = {}
+        for paper in papers:
+            nodes.setdefault(paper["paper_id"], {}).update(paper_properties(paper))
+
+        rows = [([paper_id], props) for paper_id, props in nodes.items()]
+        path = self._write_csv("papers.csv", ["paper_id:ID(Paper)"], rows)
+        self.node_files.append(("Paper", path))
+
+        print(f"  ✓ {len(rows):5d} Paper nodes -> {path.name}")
+        return len(rows)
+
+    def write_terms(self, terms: Dict) -> int:
+        """Write one node file per node type and return the number of term nodes."""
+        by_label = defaultdict(dict)
+        for category, cat_terms in terms.get("categories", {}).items():
+            node_type = get_node_type_for_category(category)
+            for term_id, term_data in cat_terms.items():
+                props = term_properties(term_id, term_data)
+                # The name is the ID column, which neo4j-admin stores as the name property
+                del props["name"]
+                by_label[node_type].setdefault(term_id, {}).update(props)
+
+        total = 0
+        for node_type, nodes in sorted(by_label.items()):
+            rows = [([name], props) for name, props in nodes.items()]
+            path = self._write_csv(f"{node_type.lower()}.csv",
+                                   [f"name:ID({node_type})"], rows)
+            self.node_files.append((node_type, path))
+            print(f"  ✓ {len(rows):5d} {node_type} nodes -> {path.name}")
+            total += len(rows)
+
+        return total
+
+    def write_relationships(self, relationships: Dict, terms: Dict) -> int:
+        """
+        Write one file per relationship type and endpoint label pair.
+
+        Endpoints are resolved to every label their name is exported under,
+        matching the Bolt exporter; relationships whose endpoints are not
+        ontology terms are skipped.
+
+        Returns:
+            Number of relationships written
+        """
+        labels = defaultdict(set)
+        for category, cat_terms in terms.get("categories", {}).items():
+            node_type = get_node_type_for_category(category)
+            for name in cat_terms:
+                labels[name].add(node_type)
+
+        by_predicate = defaultdict(list)
+        for rel in relationships.get("relationships", []):
+            by_predicate[rel["predicate"]].append(rel)
+
+        buckets = defaultdict(dict)
+        skipped = 0
+        for predicate, pred_rels in by_predicate.items():
+            rel_type = get_relationship_type_for_predicate(predicate)
+            for rel in pred_rels:
+                subj, obj = rel["subject"], rel["object"]
+                if subj not in labels or obj not in labels:
+                    skipped += 1
+                    continue
+
+                props = {"predicate": predicate, "source": rel.get("source", "")}
+                for subj_label in labels[subj]:
+                    for obj_label in labels[obj]:
+                        key = (rel_type, subj_label, obj_label)
+                        buckets[key].setdefault((subj, obj), {}).update(props)
+
+        total = 0
+        for (rel_type, subj_label, obj_label), rels in sorted(buckets.items()):
+            rows = [([s, o], props) for (s, o), props in rels.items()]
+            path = self._write_csv(
+                f"{rel_type.lower()}_{subj_label.lower()}_{obj_label.lower()}.csv",
+                [f":START_ID({subj_label})", f":END_ID({obj_label})"], rows
+            )
+            self.relationship_files.append((rel_type, path))
+            print(f"  ✓ {len(rows):5d} {rel_type} ({subj_label}->{obj_label}) -> {path.name}")
+            total += len(rows)
+
+        if skipped:
+            print(f"  ⚠️  Skipped {skipped} relationships with endpoints not in the ontology")
+
+        return total
+
+    def write_all(self, papers: List[Dict], terms: Dict, relationships: Dict) -> Dict[str, int]:
+        """
+        Write all node and relationship files.
+
+        Returns:
+            Dictionary with paper, term and relationship counts
+        """
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        self.node_files.clear()
+        self.relationship_files.clear()
+
+        print(f"\nWriting bulk import files to {self.output_dir}...")
+        return {
+            "papers": self.write_papers(papers),
+            "terms": self.write_terms(terms),
+            "relationships": self.write_relationships(relationships, terms)
+        }
+
+    def import_command(self, database: str, neo4j_admin: str = "neo4j-admin") -> List[str]:
+        """
+        Build the neo4j-admin command that imports the written files.
+
+        Args:
+            database: Name of the database to (re)create
+            neo4j_admin: Path to the neo4j-admin executable
+
+        Returns:
+            Command as an argument list
+        """
+        return [
+            neo4j_admin, "database", "import", "full",
+            "--overwrite-destination",
+            "--multiline-fields=true",
+            f"--array-delimiter={ARRAY_DELIMITER}",
+            *(f"--nodes={label}={path}" for label, path in self.node_files),
+            *(f"--relationships={rel_type}={path}"
+              for rel_type, path in self.relationship_files),
+            database
+        ]
+
+
+class KBLoader:
+    """
+    Load, filter and preview the knowledge base files.
+
+    Pure file I/O with no Neo4j dependency, so previews work without
+    credentials or a network connection.
+    """
+
+    def __init__(self, base_dir: str = None):
+        """
+        Initialize loader.
+
+        Args:
+            base_dir: Base directory of project
+        """
         self.base_dir = Path(base_dir) if base_dir else Path.cwd()
         self.kb_dir = self.base_dir / "knowledge-base"
         self.papers_dir = self.kb_dir / "papers"
         self.index_dir = self.kb_dir / "index"
         self.ontology_dir = self.kb_dir / "ontology"
 
-        self.conn = Neo4jConnection(creds_file=creds_file)
-
     def load_papers(self) -> List[Dict]:
         """Load all papers from master index."""
         master_index_file = self.index_dir / "master-index.json"
@@ -52,9 +413,7 @@ class Neo4jExporter:
             print("Warning: master-index.json not found")
             return []
 
-        with open(master_index_file, 'r') as f:
-            data = json.load(f)
-            return data.get("papers", [])
+        return load_json_file(master_index_file).get("papers", [])
 
     def load_ontology_terms(self) -> Dict:
         """Load all ontology terms."""
@@ -63,8 +422,66 @@ class Neo4jExporter:
             print("Warning: terms.json not found")
             return {}
 
-        with open(terms_file, 'r') as f:
-            return json.load(f)
+        return load_json_file(terms_file)
+
+    def load_papers_streaming(self, paper_id_filter: Set[str]) -> List[Dict]:
+        """
+        Load only the papers whose IDs are in paper_id_filter.
+
+        With ijson installed the master index is parsed incrementally, so only
+        matching papers are materialized; otherwise it falls back to a full load.
+
+        Args:
+            paper_id_filter: Paper IDs to keep
+
+        Returns:
+            List of matching paper dictionaries, in master-index order
+        """
+        if not HAS_IJSON:
+            return [p for p in self.load_papers() if p['paper_id'] in paper_id_filter]
+
+        master_index_file = self.index_dir / "master-index.json"
+        if not master_index_file.exists():
+            print("Warning: master-index.json not found")
+            return []
+
+        with open(master_index_file, 'rb') as f:
+            return [
+                p for p in ijson.items(f, 'papers.item', use_float=True)
+                if p['paper_id'] in paper_id_filter
+            ]
+
+    def load_ontology_terms_streaming(self, categories: Set[str]) -> Dict:
+        """
+        Load only the requested ontology categories.
+
+        With ijson installed terms.json is parsed incrementally, so only the
+        requested categories are materialized; otherwise it falls back to a
+        full load.
+
+        Args:
+            categories: Ontology categories to keep
+
+        Returns:
+            Terms dictionary of the form {"categories": {category: terms}}
+        """
+        if not HAS_IJSON:
+            all_terms = self.load_ontology_terms().get("categories", {})
+            return {"categories": {
+                cat: cat_terms for cat, cat_terms in all_terms.items() if cat in categories
+            }}
+
+        terms_file = self.ontology_dir / "terms.json"
+        if not terms_file.exists():
+            print("Warning: terms.json not found")
+            return {"categories": {}}
+
+        with open(terms_file, 'rb') as f:
+            return {"categories": {
+                cat: cat_terms
+                for cat, cat_terms in ijson.kvitems(f, 'categories', use_float=True)
+                if cat in categories
+            }}
 
     def load_ontology_relationships(self) -> Dict:
         """Load all ontology relationships."""
@@ -73,12 +490,12 @@ class Neo4jExporter:
             print("Warning: relationships.json not found")
             return {}
 
-        with open(rel_file, 'r') as f:
-            return json.load(f)
+        return load_json_file(rel_file)
 
     def filter_subgraph(self, paper_ids: Optional[List[str]] = None,
                        categories: Optional[List[str]] = None,
-                       organisms: Optional[List[str]] = None) -> Tuple[List, Dict, Dict]:
+                       organisms: Optional[List[str]] = None,
+                       materialize: bool = True) -> Tuple[List, Dict, Dict]:
         """
         Filter papers and ontology to create a subgraph.
 
@@ -86,28 +503,25 @@ class Neo4jExporter:
             paper_ids: List of paper IDs to include
             categories: List of ontology categories to include
             organisms: List of organisms to include
+            materialize: Return relationships as a list; if False they are a
+                one-shot generator (enough for preview_export, which iterates once)
 
         Returns:
             Tuple of (filtered_papers, filtered_terms, filtered_relationships)
         """
-        all_papers = self.load_papers()
-        all_terms = self.load_ontology_terms()
         all_rels = self.load_ontology_relationships()
 
-        # Filter papers
+        # Filter papers (streamed, so only matching papers are loaded)
         if paper_ids:
-            filtered_papers = [p for p in all_papers if p['paper_id'] in paper_ids]
+            filtered_papers = self.load_papers_streaming(set(paper_ids))
         else:
-            filtered_papers = all_papers
+            filtered_papers = self.load_papers()
 
-        # Filter terms by category
-        filtered_terms = {"categories": {}}
+        # Filter terms by category (streamed, so only requested categories are loaded)
         if categories:
-            for cat in categories:
-                if cat in all_terms.get("categories", {}):
-                    filtered_terms["categories"][cat] = all_terms["categories"][cat]
+            filtered_terms = self.load_ontology_terms_streaming(set(categories))
         else:
-            filtered_terms = all_terms
+            filtered_terms = self.load_ontology_terms()
 
         # Filter relationships
         # Get all term_ids in filtered terms
@@ -115,12 +529,19 @@ class Neo4jExporter:
         for cat_terms in filtered_terms.get("categories", {}).values():
             term_ids.update(cat_terms.keys())
 
-        filtered_rels = {
-            "relationships": [
-                rel for rel in all_rels.get("relationships", [])
+        if materialize:
+            kept = []
+            kept_append = kept.append
+            for rel in all_rels.get("relationships", ()):
+                if rel["subject"] in term_ids or rel["object"] in term_ids:
+                    kept_append(rel)
+        else:
+            kept = (
+                rel for rel in all_rels.get("relationships", ())
                 if rel["subject"] in term_ids or rel["object"] in term_ids
-            ]
-        }
+            )
+
+        filtered_rels = {"relationships": kept}
 
         # Also include hierarchies and process_flows if they exist
         if "hierarchies" in all_rels:
@@ -137,30 +558,31 @@ class Neo4jExporter:
         Args:
             papers: List of paper dictionaries
             terms: Ontology terms dictionary
-            relationships: Ontology relationships dictionary
+            relationships: Ontology relationships dictionary (the relationships
+                may be a generator; they are iterated exactly once)
         """
         print("\n" + "=" * 80)
         print("EXPORT PREVIEW")
         print("=" * 80)
 
         # Count nodes by type
-        node_counts = defaultdict(int)
-        node_counts["Paper"] = len(papers)
+        node_counts = Counter({"Paper": len(papers)})
 
-        # Count terms by category
+        # Count terms by category (several categories can share a node type)
         for category, cat_terms in terms.get("categories", {}).items():
-            node_type = get_node_type_for_category(category)
-            node_counts[node_type] += len(cat_terms)
+            node_counts.update({get_node_type_for_category(category): len(cat_terms)})
 
         print(f"\nNodes to be created ({sum(node_counts.values())} total):")
         for node_type, count in sorted(node_counts.items()):
             print(f"  {node_type:20s} {count:4d}")
 
-        # Count relationships
-        rel_counts = defaultdict(int)
-        for rel in relationships.get("relationships", []):
-            rel_type = get_relationship_type_for_predicate(rel["predicate"])
-            rel_counts[rel_type] += 1
+        # Count relationships per predicate in one Counter pass, then resolve
+        # each distinct predicate to its type once
+        predicate_counts = Counter(map(itemgetter("predicate"),
+                                       relationships.get("relationships", ())))
+        rel_counts = Counter()
+        for predicate, count in predicate_counts.items():
+            rel_counts[get_relationship_type_for_predicate(predicate)] += count
 
         print(f"\nRelationships to be created ({sum(rel_counts.values())} total):")
         for rel_type, count in sorted(rel_counts.items()):
@@ -169,21 +591,155 @@ class Neo4jExporter:
         # List papers
         if papers:
             print(f"\nPapers ({len(papers)}):")
-            for p in papers[:10]:  # Show first 10
+            for p in papers[:PREVIEW_LIMIT]:  # Show first PREVIEW_LIMIT
                 title = p.get('title', 'Unknown')[:60]
                 print(f"  - {p['paper_id']:40s} {title}")
-            if len(papers) > 10:
-                print(f"  ... and {len(papers) - 10} more")
+            if len(papers) > PREVIEW_LIMIT:
+                print(f"  ... and {len(papers) - PREVIEW_LIMIT} more")
 
-        # List term categories
-        if terms.get("categories"):
-            print(f"\nOntology Categories ({len(terms['categories'])}):")
-            for cat in sorted(terms['categories'].keys()):
-                term_count = len(terms['categories'][cat])
-                print(f"  - {cat:30s} ({term_count} terms)")
+        # List term categories (first PREVIEW_LIMIT by name, without sorting them all)
+        categories = terms.get("categories", {})
+        if categories:
+            print(f"\nOntology Categories ({len(categories)}):")
+            for cat in heapq.nsmallest(PREVIEW_LIMIT, categories):
+                print(f"  - {cat:30s} ({len(categories[cat])} terms)")
+            if len(categories) > PREVIEW_LIMIT:
+                print(f"  ... and {len(categories) - PREVIEW_LIMIT} more")
 
         print("=" * 80 + "\n")
 
+    def preview_full(self):
+        """Preview full knowledge graph export."""
+        papers = self.load_papers()
+        terms = self.load_ontology_terms()
+        relationships = self.load_ontology_relationships()
+
+        self.preview_export(papers, terms, relationships)
+
+    def preview_subgraph(self, paper_ids: Optional[List[str]] = None,
+                        categories: Optional[List[str]] = None):
+        """Preview filtered subgraph export."""
+        papers, terms, relationships = self.filter_subgraph(paper_ids, categories,
+                                                            materialize=False)
+
+        self.preview_export(papers, terms, relationships)
+
+
+class Neo4jExporter(KBLoader):
+    """
+    Export knowledge base to Neo4j graph database.
+
+    The Neo4j connection is created on first use, so the loading and preview
+    methods inherited from KBLoader never need credentials.
+    """
+
+    def __init__(self, base_dir: str = None, creds_file: str = None,
+                 max_workers: int = DEFAULT_MAX_WORKERS,
+                 keep_connection: bool = False, use_apoc: bool = False):
+        """
+        Initialize exporter.
+
+        Args:
+            base_dir: Base directory of project
+            creds_file: Path to Neo4j credentials file
+            max_workers: Concurrent sessions for batch writes (1 = serial)
+            keep_connection: Keep the driver open after each export so later
+                operations reuse it (the caller closes it with close())
+            use_apoc: Pass node labels and relationship types as parameters to
+                APOC merge procedures instead of one query per label/type
+        """
+        super().__init__(base_dir)
+        self.creds_file = creds_file
+        self.max_workers = max(1, max_workers)
+        self.keep_connection = keep_connection
+        self.use_apoc = use_apoc
+        self._conn = None
+
+    @property
+    def conn(self) -> Neo4jConnection:
+        """Neo4j connection, created (and credentials loaded) on first use."""
+        if self._conn is None:
+            self._conn = Neo4jConnection.shared(self.creds_file)
+        return self._conn
+
+    def close(self):
+        """Close the Neo4j connection if one was opened."""
+        if self._conn is not None:
+            self._conn.close()
+
+    @staticmethod
+    def _write_batch(session, query: str, batch: List[Dict]):
+        """Write one batch in a managed write transaction."""
+        def _work(tx):
+            tx.run(query, rows=batch).consume()
+
+        session.execute_write(_work)
+
+    def _write_batch_new_session(self, query: str, batch: List[Dict]) -> int:
+        """Write one batch on its own session (for use from worker threads)."""
+        with self.conn.get_session() as session:
+            self._write_batch(session, query, batch)
+        return len(batch)
+
+    def _run_batches(self, session, query: str, rows: List[Dict], label: str,
+                     key: str) -> int:
+        """
+        Run an UNWIND query over rows in BATCH_SIZE chunks.
+
+        Each chunk is sent as one query inside a managed write transaction, so
+        there is one round trip and one commit per chunk rather than per row,
+        and the driver retries the chunk on transient errors (e.g. deadlocks).
+        Non-transient failures propagate instead of silently dropping the batch.
+
+        When there is more than one chunk and max_workers > 1, rows are
+        partitioned by hash of row[key] and the chunks are written concurrently,
+        each on its own session. Partitioning keeps the nodes MERGEd by
+        different workers disjoint, which limits lock contention.
+
+        Args:
+            session: Neo4j session (used when writing serially)
+            query: Cypher query reading its input from $rows
+            rows: Row dictionaries to send
+            label: Name used in progress messages
+            key: Row field to partition on
+
+        Returns:
+            Number of rows written
+        """
+        written = 0
+
+        if self.max_workers == 1 or len(rows) <= BATCH_SIZE:
+            for start in range(0, len(rows), BATCH_SIZE):
+                batch = rows[start:start + BATCH_SIZE]
+                self._write_batch(session, query, batch)
+                written += len(batch)
+
+                if len(rows) > BATCH_SIZE:
+                    print(f"  Progress: {written}/{len(rows)} {label}")
+
+            return written
+
+        partitions = [[] for _ in range(self.max_workers)]
+        for row in rows:
+            partitions[hash(row[key]) % self.max_workers].append(row)
+
+        batches = [
+            part[start:start + BATCH_SIZE]
+            for part in partitions
+            for start in range(0, len(part), BATCH_SIZE)
+        ]
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            futures = [
+                executor.submit(self._write_batch_new_session, query, batch)
+                for batch in batches
+            ]
+            for future in as_completed(futures):
+                written += future.result()
+                print(f"  Progress: {written}/{len(rows)} {label}")
+
+        return written
+
     def create_paper_nodes(self, session, papers: List[Dict]) -> int:
         """
         Create Paper nodes in Neo4j.
@@ -196,33 +752,14 @@ class Neo4jExporter:
             Number of nodes created
         """
         print(f"\nCreating {len(papers)} Paper nodes...")
-        created = 0
 
-        for paper in papers:
-            try:
-                query = """
-                MERGE (p:Paper {paper_id: $paper_id})
-                SET p.doi = $doi,
-                    p.title = $title,
-                    p.authors = $authors,
-                    p.year = $year,
-                    p.date_added = $date_added
-                """
-
-                session.run(query,
-                           paper_id=paper["paper_id"],
-                           doi=paper.get("doi", ""),
-                           title=paper.get("title", ""),
-                           authors=paper.get("authors", []),
-                           year=paper.get("year"),
-                           date_added=paper.get("date_added", ""))
-                created += 1
-
-                if created % 10 == 0:
-                    print(f"  Progress: {created}/{len(papers)}")
+        rows = [
+            {"paper_id": paper["paper_id"], "props": paper_properties(paper)}
+            for paper in papers
+        ]
 
-            except Exception as e:
-                print(f"  ✗ Failed to create Paper {paper['paper_id']}: {e}")
+        created = self._run_batches(session, PAPER_MERGE_QUERY, rows, "Paper",
+                                   key="paper_id")
 
         print(f"✓ Created {created} Paper nodes")
         return created
@@ -238,99 +775,152 @@ class Neo4jExporter:
         Returns:
             Number of nodes created
         """
+        # Several categories can map to the same node type; merge their terms
+        # per (node type, name) so each node is sent once, with properties
+        # combined the way successive SET += would combine them
+        by_type = defaultdict(dict)
+        for category, cat_terms in terms.get("categories", {}).items():
+            nodes = by_type[get_node_type_for_category(category)]
+            for term_id, term_data in cat_terms.items():
+                nodes.setdefault(term_id, {}).update(term_properties(term_id, term_data))
+
+        if self.use_apoc:
+            rows = [
+                {"label": node_type, "name": name, "props": props}
+                for node_type, nodes in by_type.items()
+                for name, props in nodes.items()
+            ]
+
+            print(f"\nCreating {len(rows)} term nodes (APOC)...")
+            created = self._run_batches(session, APOC_TERM_MERGE_QUERY, rows, "term",
+                                        key="name")
+            print(f"✓ Created {created} term nodes")
+            return created
+
         total_created = 0
 
-        for category, cat_terms in terms.get("categories", {}).items():
-            node_type = get_node_type_for_category(category)
+        for node_type, nodes in by_type.items():
+            print(f"\nCreating {len(nodes)} {node_type} nodes...")
 
-            print(f"\nCreating {len(cat_terms)} {node_type} nodes from '{category}'...")
-            created = 0
+            rows = [{"name": name, "props": props} for name, props in nodes.items()]
 
-            for term_id, term_data in cat_terms.items():
-                try:
-                    # Build properties dict
-                    props = {
-                        "name": term_id,
-                        "definition": term_data.get("definition", ""),
-                        "source": term_data.get("source", "")
-                    }
-
-                    # Add synonyms if present
-                    if "synonyms" in term_data:
-                        props["synonyms"] = term_data["synonyms"]
-
-                    # Add category-specific properties
-                    if "variants" in term_data:
-                        props["variants"] = term_data["variants"]
-                    if "organisms" in term_data:
-                        props["organisms"] = term_data["organisms"]
-                    if "radical_forms" in term_data:
-                        props["radical_forms"] = term_data["radical_forms"]
-                    if "typical_values" in term_data:
-                        props["typical_values"] = term_data["typical_values"]
-                    if "applications" in term_data:
-                        props["applications"] = term_data["applications"]
-
-                    # Create node
-                    query = f"""
-                    MERGE (n:{node_type} {{name: $name}})
-                    SET n += $props
-                    """
-
-                    session.run(query, name=term_id, props=props)
-                    created += 1
-
-                except Exception as e:
-                    print(f"  ✗ Failed to create {node_type} {term_id}: {e}")
+            created = self._run_batches(session, TERM_MERGE_QUERIES[node_type], rows,
+                                        node_type, key="name")
 
             print(f"✓ Created {created} {node_type} nodes")
             total_created += created
 
         return total_created
 
-    def create_relationships(self, session, relationships: Dict) -> int:
+    def build_label_index(self, terms: Dict) -> Dict[str, Optional[str]]:
+        """
+        Map each ontology term name to the node label it is exported under.
+
+        Names that appear under categories with different labels map to None,
+        since their label cannot be determined from the name alone.
+
+        Args:
+            terms: Ontology terms dictionary
+
+        Returns:
+            Dictionary of term name -> node label (or None if ambiguous)
+        """
+        labels = {}
+        for category, cat_terms in terms.get("categories", {}).items():
+            node_type = get_node_type_for_category(category)
+            for name in cat_terms:
+                if labels.get(name, node_type) != node_type:
+                    labels[name] = None
+                else:
+                    labels[name] = node_type
+        return labels
+
+    def create_relationships(self, session, relationships: Dict,
+                             terms: Optional[Dict] = None) -> int:
         """
         Create relationships from ontology.
 
+        When terms are given, endpoints are matched by label as well as name
+        so the lookups use the per-label uniqueness constraints.
+
         Args:
             session: Neo4j session
             relationships: Ontology relationships dictionary
+            terms: Ontology terms dictionary used to resolve endpoint labels
 
         Returns:
             Number of relationships created
         """
         rels = relationships.get("relationships", [])
         print(f"\nCreating {len(rels)} relationships...")
-        created = 0
 
+        labels = self.build_label_index(terms) if terms else {}
+
+        # Relationship type per distinct predicate, resolved once each
+        rel_types = {
+            predicate: get_relationship_type_for_predicate(predicate)
+            for predicate in {rel["predicate"] for rel in rels}
+        }
+
+        # Group rows by (subject label, object label, relationship type);
+        # each group gets its own UNWIND query. Within a group, rows are keyed
+        # on (subject, object): MERGE would collapse those into one relationship
+        # anyway, so duplicates are dropped here (the last one wins, as its
+        # SET would) instead of costing a server-side uniqueness check each.
+        buckets = defaultdict(dict)
         for rel in rels:
-            try:
-                subject = rel["subject"]
-                predicate = rel["predicate"]
-                obj = rel["object"]
-                source = rel.get("source", "")
-
-                # Get relationship type
-                rel_type = get_relationship_type_for_predicate(predicate)
-
-                # Create relationship
-                query = f"""
-                MATCH (a {{name: $subject}})
-                MATCH (b {{name: $object}})
-                MERGE (a)-[r:{rel_type}]->(b)
-                SET r.predicate = $predicate,
-                    r.source = $source
-                """
-
-                session.run(query, subject=subject, object=obj,
-                           predicate=predicate, source=source)
-                created += 1
-
-                if created % 50 == 0:
-                    print(f"  Progress: {created}/{len(rels)}")
+            predicate = rel["predicate"]
+            rel_type = rel_types[predicate]
+            key = (labels.get(rel["subject"]), labels.get(rel["object"]), rel_type)
+            buckets[key][(rel["subject"], rel["object"])] = {
+                "s": rel["subject"],
+                "o": rel["object"],
+                "props": {
+                    "predicate": predicate,
+                    "source": rel.get("source", "")
+                }
+            }
+
+        buckets = {key: list(rows.values()) for key, rows in buckets.items()}
+        duplicates = len(rels) - sum(len(rows) for rows in buckets.values())
+        if duplicates:
+            print(f"  Skipped {duplicates} duplicate relationships")
+
+        if self.use_apoc:
+            return self._create_relationships_apoc(session, buckets)
 
-            except Exception as e:
-                print(f"  ✗ Failed to create relationship {subject}-[{predicate}]->{obj}: {e}")
+        created = 0
+        for (subj_label, obj_label, rel_type), rows in buckets.items():
+            query = relationship_merge_query(subj_label, obj_label, rel_type)
+            created += self._run_batches(session, query, rows, rel_type, key="s")
+
+        print(f"✓ Created {created} relationships")
+        return created
+
+    def _create_relationships_apoc(self, session, buckets: Dict) -> int:
+        """
+        Create relationships with apoc.merge.relationship.
+
+        The relationship type is passed per row, so there is one query per
+        endpoint label pair rather than per (label pair, type); endpoints stay
+        labelled so their lookups still use the uniqueness constraints.
+
+        Args:
+            session: Neo4j session
+            buckets: Rows keyed by (subject label, object label, relationship type)
+
+        Returns:
+            Number of relationships created
+        """
+        by_labels = defaultdict(list)
+        for (subj_label, obj_label, rel_type), rows in buckets.items():
+            by_labels[(subj_label, obj_label)].extend(dict(row, type=rel_type) for row in rows)
+
+        created = 0
+        for (subj_label, obj_label), rows in by_labels.items():
+            query = apoc_relationship_merge_query(subj_label, obj_label)
+            created += self._run_batches(session, query, rows,
+                                         f"{subj_label or 'any'}->{obj_label or 'any'}", key="s")
 
         print(f"✓ Created {created} relationships")
         return created
@@ -352,7 +942,8 @@ class Neo4jExporter:
         self.conn.connect()
 
         with self.conn.get_session() as session:
-            # Create indexes
+            # Create constraints and indexes before ingest so MERGEs use index seeks
+            create_constraints(session)
             create_indexes(session)
 
             # Create nodes
@@ -360,7 +951,7 @@ class Neo4jExporter:
             term_count = self.create_term_nodes(session, terms)
 
             # Create relationships
-            rel_count = self.create_relationships(session, relationships)
+            rel_count = self.create_relationships(session, relationships, terms)
 
         print("\n" + "=" * 80)
         print("EXPORT COMPLETE")
@@ -376,7 +967,8 @@ class Neo4jExporter:
         print(f"  Total nodes: {info['node_count']}")
         print(f"  Total relationships: {info['relationship_count']}")
 
-        self.conn.close()
+        if not self.keep_connection:
+            self.conn.close()
 
     def export_full(self):
         """Export full knowledge graph to Neo4j."""
@@ -386,13 +978,54 @@ class Neo4jExporter:
 
         self.export_to_neo4j(papers, terms, relationships)
 
-    def preview_full(self):
-        """Preview full knowledge graph export."""
+    def export_full_bulk(self, output_dir: Optional[str] = None,
+                         neo4j_admin: str = "neo4j-admin", run_import: bool = True,
+                         database: Optional[str] = None):
+        """
+        Export full knowledge graph through neo4j-admin bulk import.
+
+        Writes admin-import CSVs, then runs `neo4j-admin database import full`,
+        which bypasses the transaction log. The target database must be stopped
+        and is overwritten. Constraints and indexes are not part of the import;
+        create them with --create-schema once the database is started again.
+
+        Args:
+            output_dir: Directory for the CSV files (default: <base_dir>/neo4j-import)
+            neo4j_admin: Path to the neo4j-admin executable
+            run_import: Run neo4j-admin after writing (False only writes the files)
+            database: Target database (default: the one in the credentials file;
+                DEFAULT_DATABASE when only writing, so no credentials are needed)
+        """
         papers = self.load_papers()
         terms = self.load_ontology_terms()
         relationships = self.load_ontology_relationships()
 
-        self.preview_export(papers, terms, relationships)
+        writer = BulkCSVWriter(output_dir or self.base_dir / "neo4j-import")
+        counts = writer.write_all(papers, terms, relationships)
+        print(f"✓ Wrote {counts['papers']} papers, {counts['terms']} terms, "
+              f"{counts['relationships']} relationships")
+
+        if database is None:
+            database = self.conn.creds["database"] if run_import else DEFAULT_DATABASE
+        command = writer.import_command(database, neo4j_admin)
+        if not run_import:
+            print("\nImport with (database must be stopped):")
+            print("  " + " ".join(command))
+            return
+
+        print(f"\nRunning {neo4j_admin} database import full...")
+        subprocess.run(command, check=True)
+        print("✓ Bulk import complete. Start the database, then run --create-schema.")
+
+    def create_schema(self):
+        """Create constraints and indexes on the connected database."""
+        self.conn.connect()
+        with self.conn.get_session() as session:
+            create_constraints(session)
+            create_indexes(session)
+
+        if not self.keep_connection:
+            self.conn.close()
 
     def export_subgraph(self, paper_ids: Optional[List[str]] = None,
                        categories: Optional[List[str]] = None):
@@ -401,16 +1034,9 @@ class Neo4jExporter:
 
         self.export_to_neo4j(papers, terms, relationships)
 
-    def preview_subgraph(self, paper_ids: Optional[List[str]] = None,
-                        categories: Optional[List[str]] = None):
-        """Preview filtered subgraph export."""
-        papers, terms, relationships = self.filter_subgraph(paper_ids, categories)
 
-        self.preview_export(papers, terms, relationships)
-
-
-def main():
-    """Command-line interface."""
+def build_parser() -> argparse.ArgumentParser:
+    """Build the command-line parser (also used for daemon commands)."""
     parser = argparse.ArgumentParser(
         description="Export magnetosensitivity knowledge base to Neo4j"
     )
@@ -422,12 +1048,18 @@ def main():
                        help="Preview full graph export")
     parser.add_argument("--export-full", action="store_true",
                        help="Export full graph to Neo4j")
+    parser.add_argument("--export-full-bulk", action="store_true",
+                       help="Export full graph with neo4j-admin bulk import (database must be stopped)")
+    parser.add_argument("--create-schema", action="store_true",
+                       help="Create constraints and indexes (e.g. after a bulk import)")
     parser.add_argument("--preview-subgraph", action="store_true",
                        help="Preview subgraph export")
     parser.add_argument("--export-subgraph", action="store_true",
                        help="Export subgraph to Neo4j")
     parser.add_argument("--clear-graph", action="store_true",
                        help="Clear all data from Neo4j (requires --confirm)")
+    parser.add_argument("--daemon", action="store_true",
+                       help="Keep one connection open and run commands read from stdin")
 
     # Filters
     parser.add_argument("--paper-ids", help="Comma-separated list of paper IDs")
@@ -438,52 +1070,158 @@ def main():
                        help="Confirm destructive operations")
     parser.add_argument("--base-dir", help="Base directory of project")
     parser.add_argument("--creds", help="Path to Neo4j credentials file")
+    parser.add_argument("--apoc", action="store_true",
+                       help="Use APOC merge procedures with parameterized labels/types (requires APOC)")
+    parser.add_argument("--workers", type=int, default=DEFAULT_MAX_WORKERS,
+                       help=f"Concurrent sessions for batch writes (default: {DEFAULT_MAX_WORKERS})")
+    parser.add_argument("--bulk-dir", help="Output directory for bulk import CSVs")
+    parser.add_argument("--neo4j-admin", default="neo4j-admin",
+                       help="Path to the neo4j-admin executable")
+    parser.add_argument("--write-only", action="store_true",
+                       help="With --export-full-bulk, write CSVs without running neo4j-admin")
+    parser.add_argument("--database",
+                       help="With --export-full-bulk, target database "
+                            f"(default: from credentials; {DEFAULT_DATABASE} with --write-only)")
+
+    return parser
+
+
+def confirm_action(args, interactive: bool = True) -> bool:
+    """
+    Confirm a destructive command.
+
+    Args:
+        args: Parsed arguments (--confirm skips the prompt)
+        interactive: Prompt on stdin; if False, --confirm is required
+
+    Returns:
+        True if the command should proceed
+    """
+    if args.confirm:
+        return True
+    if not interactive:
+        print("Add --confirm to run this command in daemon mode.")
+        return False
+
+    response = input("Continue? (yes/no): ")
+    if response.lower() != 'yes':
+        print("Cancelled.")
+        return False
+    return True
+
+
+def run_command(exporter: Neo4jExporter, args, parser: argparse.ArgumentParser,
+                interactive: bool = True):
+    """
+    Run the action selected by parsed arguments.
+
+    Args:
+        exporter: Exporter to run the action with
+        args: Parsed arguments
+        parser: Parser (for printing help)
+        interactive: Whether confirmations may prompt on stdin
+    """
+    # Parse filters
+    paper_ids = args.paper_ids.split(',') if args.paper_ids else None
+    categories = args.categories.split(',') if args.categories else None
 
-    args = parser.parse_args()
+    if args.test_connection:
+        exporter.conn.test_connection()
 
-    # Set base directory
-    base_dir = args.base_dir if args.base_dir else "/Users/clarice/Desktop/Claude test"
+    elif args.preview_full:
+        exporter.preview_full()
 
-    # Initialize exporter
-    exporter = Neo4jExporter(base_dir=base_dir, creds_file=args.creds)
+    elif args.export_full:
+        print("\n⚠️  This will export the FULL knowledge graph to Neo4j.")
+        if confirm_action(args, interactive):
+            exporter.export_full()
+
+    elif args.export_full_bulk:
+        if not args.write_only:
+            print("\n⚠️  This will OVERWRITE the Neo4j database with a bulk import.")
+            print("   The database must be stopped first.")
+            if not confirm_action(args, interactive):
+                return
+        exporter.export_full_bulk(output_dir=args.bulk_dir,
+                                  neo4j_admin=args.neo4j_admin,
+                                  run_import=not args.write_only,
+                                  database=args.database)
+
+    elif args.create_schema:
+        exporter.create_schema()
+
+    elif args.preview_subgraph:
+        exporter.preview_subgraph(paper_ids=paper_ids, categories=categories)
+
+    elif args.export_subgraph:
+        print("\n⚠️  This will export a SUBGRAPH to Neo4j.")
+        if confirm_action(args, interactive):
+            exporter.export_subgraph(paper_ids=paper_ids, categories=categories)
+
+    elif args.clear_graph:
+        exporter.conn.clear_database(confirm=args.confirm)
+
+    else:
+        parser.print_help()
 
-    # Parse filters
-    paper_ids = args.paper_ids.split(',') if args.paper_ids else None
-    categories = args.categories.split(',') if args.categories else None
+
+def run_daemon(exporter: Neo4jExporter, parser: argparse.ArgumentParser):
+    """
+    Run commands read from stdin, one per line, on a single open driver.
+
+    Each line takes the same action and filter flags as the command line
+    (e.g. `--export-subgraph --paper-ids nchem_2447 --confirm`); destructive
+    commands require --confirm. --base-dir, --creds and --workers are fixed
+    at startup. Enter `quit` or send EOF to stop.
+
+    Args:
+        exporter: Exporter whose connection is kept open between commands
+        parser: Parser used for each command line
+    """
+    exporter.keep_connection = True
+    print("Neo4j exporter daemon ready (one command per line, 'quit' to exit)")
 
     try:
-        if args.test_connection:
-            exporter.conn.test_connection()
-
-        elif args.preview_full:
-            exporter.preview_full()
-
-        elif args.export_full:
-            print("\n⚠️  This will export the FULL knowledge graph to Neo4j.")
-            if not args.confirm:
-                response = input("Continue? (yes/no): ")
-                if response.lower() != 'yes':
-                    print("Cancelled.")
-                    sys.exit(0)
-            exporter.export_full()
+        for line in sys.stdin:
+            line = line.strip()
+            if not line or line.startswith('#'):
+                continue
+            if line in ('quit', 'exit'):
+                break
 
-        elif args.preview_subgraph:
-            exporter.preview_subgraph(paper_ids=paper_ids, categories=categories)
+            try:
+                args = parser.parse_args(shlex.split(line))
+            except SystemExit:
+                # argparse already printed the usage error
+                continue
 
-        elif args.export_subgraph:
-            print("\n⚠️  This will export a SUBGRAPH to Neo4j.")
-            if not args.confirm:
-                response = input("Continue? (yes/no): ")
-                if response.lower() != 'yes':
-                    print("Cancelled.")
-                    sys.exit(0)
-            exporter.export_subgraph(paper_ids=paper_ids, categories=categories)
+            try:
+                run_command(exporter, args, parser, interactive=False)
+            except Exception as e:
+                print(f"\n✗ Error: {e}")
 
-        elif args.clear_graph:
-            exporter.conn.clear_database(confirm=args.confirm)
+            sys.stdout.flush()
+    finally:
+        exporter.close()
 
+
+def main():
+    """Command-line interface."""
+    parser = build_parser()
+    args = parser.parse_args()
+
+    # Set base directory
+    base_dir = args.base_dir if args.base_dir else "/Users/clarice/Desktop/Claude test"
+
+    # Initialize exporter
+    exporter = Neo4jExporter(base_dir=base_dir, creds_file=args.creds,
+                             max_workers=args.workers, use_apoc=args.apoc)
+
+    try:
+        if args.daemon:
+            run_daemon(exporter, parser)
         else:
-            parser.print_help()
+            run_command(exporter, args, parser)
 
     except KeyboardInterrupt:
         print("\n\nInterrupted by user")
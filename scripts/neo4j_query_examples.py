@@ -98,8 +98,8 @@ QUERIES = {
     "most_studied_proteins": {
         "description": "Proteins studied by most papers",
         "cypher": """
-        MATCH (p:Paper)-[:STUDIES]->(protein:Protein)
-        RETURN protein.name, count(p) AS paper_count
+        MATCH (:Paper)-[r:STUDIES]->(protein:Protein)
+        RETURN protein.name, count(r) AS paper_count
         ORDER BY paper_count DESC
         LIMIT 10
         """
@@ -126,9 +126,9 @@ QUERIES = {
     "shortest_path_hyperfine_compass": {
         "description": "Shortest path from hyperfine coupling to magnetic compass",
         "cypher": """
-        MATCH path = shortestPath(
-          (start {name: 'hyperfine_coupling'})-[*]-(end {name: 'magnetic_compass'})
-        )
+        MATCH (start:Term {name: 'hyperfine_coupling'}),
+              (end:Mechanism {name: 'magnetic_compass'})
+        MATCH path = shortestPath((start)-[*..6]-(end))
         RETURN [node in nodes(path) | node.name] AS path_nodes,
                length(path) AS path_length
         """
@@ -162,7 +162,15 @@ QUERIES = {
     },
 
     "graph_statistics": {
-        "description": "Overall graph statistics",
+        "description": "Overall graph statistics from the count store (requires APOC)",
+        "cypher": """
+        CALL apoc.meta.stats() YIELD labels, relTypesCount
+        RETURN labels, relTypesCount
+        """
+    },
+
+    "graph_statistics_scan": {
+        "description": "Overall graph statistics by scanning the graph (no APOC needed)",
         "cypher": """
         MATCH (n)
         WITH labels(n)[0] AS label, count(n) AS count
@@ -249,20 +257,27 @@ def run_query(query_name: str, conn: Neo4jConnection, limit: int = 100):
     try:
         with conn.get_session() as session:
             result = session.run(query_info['cypher'])
-            records = list(result)
+
+            # Keep at most limit records; the rest are only counted, not held in memory
+            records = []
+            total = 0
+            for record in result:
+                total += 1
+                if total <= limit:
+                    records.append(record)
 
             if not records:
                 print("No results found.\n")
                 return
 
-            print(f"Results ({len(records)} total, showing first {min(len(records), limit)}):\n")
+            print(f"Results ({total} total, showing first {len(records)}):\n")
 
             # Display results
-            for i, record in enumerate(records[:limit], 1):
+            for i, record in enumerate(records, 1):
                 print(f"{i}. {dict(record)}")
 
-            if len(records) > limit:
-                print(f"\n... and {len(records) - limit} more results")
+            if total > limit:
+                print(f"\n... and {total - limit} more results")
 
             print()
 
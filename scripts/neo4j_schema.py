@@ -9,7 +9,10 @@ Author: Francois
 Date: 2025-11-04
 """
 
-from typing import Dict, List
+import sys
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Dict, Mapping, Sequence, Tuple
 
 # Node type definitions with properties
 NODE_TYPES = {
@@ -25,19 +28,21 @@ NODE_TYPES = {
             "abstract": "str (optional)",
             "journal": "str (optional)"
         },
-        "indexes": ["paper_id", "doi"]
+        "uniques": ["paper_id"],
+        "indexes": ["doi", "year"]
     },
 
     "Term": {
         "description": "Ontology term (mechanism, concept, etc.)",
         "properties": {
-            "term_id": "str (required, unique)",
+            "name": "str (required, unique)",
             "category": "str (required)",
             "definition": "str (required)",
             "synonyms": "list[str]",
             "source": "str (DOI or paper_id)"
         },
-        "indexes": ["term_id", "category"]
+        "uniques": ["name"],
+        "indexes": ["category"]
     },
 
     "Protein": {
@@ -48,7 +53,7 @@ NODE_TYPES = {
             "organisms": "list[str]",
             "definition": "str"
         },
-        "indexes": ["name"]
+        "uniques": ["name"]
     },
 
     "Organism": {
@@ -58,7 +63,7 @@ NODE_TYPES = {
             "scientific_name": "str (optional)",
             "common_names": "list[str]"
         },
-        "indexes": ["name"]
+        "uniques": ["name"]
     },
 
     "Technique": {
@@ -69,7 +74,8 @@ NODE_TYPES = {
             "applications": "list[str]",
             "synonyms": "list[str]"
         },
-        "indexes": ["name", "type"]
+        "uniques": ["name"],
+        "indexes": ["type"]
     },
 
     "MagneticField": {
@@ -80,7 +86,7 @@ NODE_TYPES = {
             "typical_values": "str (range or value with units)",
             "definition": "str"
         },
-        "indexes": ["name"]
+        "uniques": ["name"]
     },
 
     "Cofactor": {
@@ -90,7 +96,7 @@ NODE_TYPES = {
             "radical_forms": "list[str]",
             "definition": "str"
         },
-        "indexes": ["name"]
+        "uniques": ["name"]
     },
 
     "Mechanism": {
@@ -100,7 +106,7 @@ NODE_TYPES = {
             "definition": "str (required)",
             "synonyms": "list[str]"
         },
-        "indexes": ["name"]
+        "uniques": ["name"]
     }
 }
 
@@ -226,8 +232,22 @@ RELATIONSHIP_TYPES = {
     }
 }
 
+
+def _freeze(mapping: Dict[str, str]) -> Mapping[str, str]:
+    """
+    Intern the keys and values of a lookup table and make it read-only.
+
+    Args:
+        mapping: String-to-string dictionary
+
+    Returns:
+        Read-only view of the interned dictionary
+    """
+    return MappingProxyType({sys.intern(k): sys.intern(v) for k, v in mapping.items()})
+
+
 # Category mapping from ontology to node types
-ONTOLOGY_CATEGORY_MAPPING = {
+ONTOLOGY_CATEGORY_MAPPING = _freeze({
     "mechanisms": "Mechanism",
     "proteins": "Protein",
     "cofactors_and_radicals": "Cofactor",
@@ -238,10 +258,10 @@ ONTOLOGY_CATEGORY_MAPPING = {
     "magnetic_interactions": "Term",
     "photochemistry": "Term",
     "spin_states": "Term"
-}
+})
 
 # Relationship predicate mapping from ontology to Neo4j relationship types
-PREDICATE_MAPPING = {
+PREDICATE_MAPPING = _freeze({
     "is_a": "IS_A",
     "contains": "CONTAINS",
     "exhibits": "EXHIBITS",
@@ -268,7 +288,12 @@ PREDICATE_MAPPING = {
     "produces": "RELATED_TO",
     "characteristic_of": "RELATED_TO",
     "enhances": "RELATED_TO"
-}
+})
+
+# Bound lookups on private plain-dict copies: dict.get is a single C call,
+# cheaper than going through the read-only proxy or a frozenset pre-check
+_node_type_lookup = dict(ONTOLOGY_CATEGORY_MAPPING).get
+_relationship_type_lookup = dict(PREDICATE_MAPPING).get
 
 
 def get_node_type_for_category(category: str) -> str:
@@ -281,7 +306,7 @@ def get_node_type_for_category(category: str) -> str:
     Returns:
         Node type string (e.g., "Mechanism", "Protein")
     """
-    return ONTOLOGY_CATEGORY_MAPPING.get(category, "Term")
+    return _node_type_lookup(category, "Term")
 
 
 def get_relationship_type_for_predicate(predicate: str) -> str:
@@ -294,13 +319,16 @@ def get_relationship_type_for_predicate(predicate: str) -> str:
     Returns:
         Relationship type string (e.g., "IS_A", "CONTAINS")
     """
-    return PREDICATE_MAPPING.get(predicate, "RELATED_TO")
+    return _relationship_type_lookup(predicate, "RELATED_TO")
 
 
+@lru_cache(maxsize=1)
 def get_schema_summary() -> str:
     """
     Get a formatted summary of the graph schema.
 
+    The schema is static, so the string is built once and reused.
+
     Returns:
         Multi-line string with schema information
     """
@@ -313,6 +341,8 @@ def get_schema_summary() -> str:
     for node_type, spec in NODE_TYPES.items():
         summary.append(f"\n  {node_type}: {spec['description']}")
         summary.append(f"    Properties: {len(spec['properties'])}")
+        if spec.get('uniques'):
+            summary.append(f"    Unique: {', '.join(spec['uniques'])}")
         if spec.get('indexes'):
             summary.append(f"    Indexes: {', '.join(spec['indexes'])}")
 
@@ -327,26 +357,101 @@ def get_schema_summary() -> str:
     return "\n".join(summary)
 
 
-def create_indexes(session):
+@lru_cache(maxsize=1)
+def constraint_statements() -> Tuple[Tuple[str, str], ...]:
+    """
+    Get the uniqueness constraint DDL for every "uniques" property.
+
+    Returns:
+        Tuple of (description, Cypher statement) pairs
     """
-    Create indexes for all node types in Neo4j.
+    return tuple([
+        (f"Unique constraint on {node_type}.{key}",
+         f"CREATE CONSTRAINT {node_type.lower()}_{key}_unique IF NOT EXISTS "
+         f"FOR (n:{node_type}) REQUIRE n.{key} IS UNIQUE")
+        for node_type, spec in NODE_TYPES.items()
+        for key in spec.get('uniques', [])
+    ])
+
+
+@lru_cache(maxsize=1)
+def index_statements() -> Tuple[Tuple[str, str], ...]:
+    """
+    Get the index DDL for non-unique secondary properties.
+
+    Properties listed under "uniques" are not indexed here; their
+    uniqueness constraint already provides the index.
+
+    Returns:
+        Tuple of (description, Cypher statement) pairs
+    """
+    return tuple([
+        (f"Index on {node_type}.{index_prop}",
+         f"CREATE INDEX IF NOT EXISTS FOR (n:{node_type}) ON (n.{index_prop})")
+        for node_type, spec in NODE_TYPES.items()
+        for index_prop in spec.get('indexes', [])
+    ])
+
+
+def _run_schema_statements(session, statements: Sequence[Tuple[str, str]]):
+    """
+    Run schema statements in a single write transaction.
+
+    If the batch fails (e.g. one statement conflicts with an existing
+    index), the statements are retried one at a time so each failure is
+    reported and the rest are still created.
 
     Args:
         session: Neo4j session object
+        statements: Sequence of (description, Cypher statement) pairs
     """
-    print("Creating indexes...")
+    def _work(tx):
+        for _, query in statements:
+            tx.run(query).consume()
+
+    try:
+        session.execute_write(_work)
+        for description, _ in statements:
+            print(f"  ✓ {description}")
+        return
+    except Exception as e:
+        print(f"  ⚠️  Batched schema update failed ({e}); retrying one at a time")
+
+    for description, query in statements:
+        try:
+            session.run(query).consume()
+            print(f"  ✓ {description}")
+        except Exception as e:
+            print(f"  ✗ Failed: {description}: {e}")
+
+
+def create_constraints(session):
+    """
+    Create uniqueness constraints on each node type's "uniques" properties.
 
-    for node_type, spec in NODE_TYPES.items():
-        if 'indexes' in spec:
-            for index_prop in spec['indexes']:
-                try:
-                    # Create index
-                    query = f"CREATE INDEX IF NOT EXISTS FOR (n:{node_type}) ON (n.{index_prop})"
-                    session.run(query)
-                    print(f"  ✓ Index on {node_type}.{index_prop}")
-                except Exception as e:
-                    print(f"  ✗ Failed to create index on {node_type}.{index_prop}: {e}")
+    Run before ingest so MERGE and MATCH on these keys use index seeks.
+    All constraints are created in one transaction.
+
+    Args:
+        session: Neo4j session object
+    """
+    print("Creating constraints...")
+    _run_schema_statements(session, constraint_statements())
+    print("✓ Constraints created")
+
+
+def create_indexes(session):
+    """
+    Create indexes on the secondary properties of all node types.
 
+    Unique properties are covered by create_constraints instead. All
+    indexes are created in one transaction.
+
+    Args:
+        session: Neo4j session object
+    """
+    print("Creating indexes...")
+    _run_schema_statements(session, index_statements())
     print("✓ Indexes created")
 
 
@@ -10,14 +10,22 @@ Author: Research Knowledge Base System
 Date: 2025-10-09
 """
 
+import asyncio
+import io
 import os
 import sys
-import json
 import hashlib
+import mmap
+import string
+import time
 import requests
+import xml.etree.ElementTree as ET
+from requests.adapters import HTTPAdapter
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from itertools import repeat
 from pathlib import Path
 from datetime import datetime
-from typing import Dict, List, Optional, Tuple
+from typing import BinaryIO, Dict, Iterable, Iterator, List, Optional, Tuple, Union
 import re
 
 # Optional imports with graceful fallback
@@ -42,29 +50,208 @@ except ImportError:
     HAS_PYPDF = False
     print("Warning: pypdf not installed. Install with: pip install pypdf")
 
+try:
+    import pikepdf
+    HAS_PIKEPDF = True
+except ImportError:
+    HAS_PIKEPDF = False
+
+try:
+    from requests_toolbelt import MultipartEncoder
+    HAS_TOOLBELT = True
+except ImportError:
+    HAS_TOOLBELT = False
+
+try:
+    import httpx
+    HAS_HTTPX = True
+except ImportError:
+    HAS_HTTPX = False
+
+from json_io import load_json_file, write_json_file
+
+# Seconds a GROBID liveness result is reused before probing again
+GROBID_CHECK_TTL = 60
+
+# Seconds to wait for the GROBID liveness probe
+GROBID_CHECK_TIMEOUT = 1
+
+# Pooled HTTP connections kept per GROBID host
+GROBID_POOL_SIZE = 8
+
+# Last liveness result per GROBID URL: url -> (checked_at, available);
+# shared so processors created in a loop do not each probe the server
+_grobid_status: Dict[str, Tuple[float, bool]] = {}
+
+# Pages per pdfplumber worker task when extracting large PDFs in parallel
+PDFPLUMBER_CHUNK_PAGES = 16
+
+# Leading lines of the extracted text searched by the title/author heuristics
+TITLE_SCAN_LINES = 20
+AUTHOR_SCAN_LINES = 50
+
+# "Abstract" heading up to the next blank line / introduction / section 1 / keywords
+_ABSTRACT_RE = re.compile(
+    r'abstract[:\s]+(.*?)(?=\n\n|\nintroduction|\n1\.|\nkey)',
+    re.IGNORECASE | re.DOTALL
+)
+
+# Characters kept in paper IDs; anything else becomes "_". ASCII filenames go
+# through the byte table (bytes.translate), others through the regex
+_PAPER_ID_CHARS = (string.ascii_letters + string.digits + "_-").encode('ascii')
+_PAPER_ID_TABLE = bytes(c if c in _PAPER_ID_CHARS else ord('_') for c in range(256))
+_PAPER_ID_RE = re.compile(r'[^a-zA-Z0-9_-]')
+
+# Directory under base_dir holding extraction results keyed by PDF SHA-256
+EXTRACTION_CACHE_DIR = ".cache"
+
+# Part of every cache key; bump when extraction output changes so stale
+# entries are ignored
+EXTRACTION_CACHE_VERSION = 1
+
+# Extraction methods in the order cached results are preferred; each method
+# is cached under its own key so a fallback result never stands in for GROBID
+EXTRACTION_CACHE_METHODS = ("grobid", "pymupdf", "pdfplumber")
+
+# TEI namespace used by GROBID output
+TEI_NS = "{http://www.tei-c.org/ns/1.0}"
+
+
+def _tei_text(elem) -> str:
+    """Return the whitespace-normalized text content of a TEI element."""
+    return " ".join("".join(elem.itertext()).split())
+
+
+def _leading_lines(text: str, n: int) -> List[str]:
+    """
+    Return the first n lines of text, like text.split('\n', n)[:n].
+
+    Locates the n-th newline with str.find and splits only up to it, so the
+    remainder of a multi-megabyte text is never copied.
+
+    Args:
+        text: Text to split
+        n: Maximum number of lines to return
+
+    Returns:
+        List of at most n lines
+    """
+    find = text.find
+    end = -1
+    for _ in range(n):
+        end = find('\n', end + 1)
+        if end == -1:
+            return text.split('\n')
+    return text[:end].split('\n')
+
+
+def _map_file(path: Union[str, Path]) -> Union[mmap.mmap, bytes]:
+    """
+    Map a file into memory read-only.
+
+    The mapping stays valid after the file is closed and is released when
+    the last reference to it goes away. Empty files (which cannot be
+    mapped) return b"".
+    """
+    with open(path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return b""
+        return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+
+def _pdf_sha256(pdf_path: Union[str, Path]) -> str:
+    """Return the hex SHA-256 digest of a file's bytes."""
+    with open(pdf_path, 'rb') as f:
+        if hasattr(hashlib, 'file_digest'):  # Python 3.11+
+            return hashlib.file_digest(f, 'sha256').hexdigest()
+        digest = hashlib.sha256()
+        for chunk in iter(lambda: f.read(1 << 20), b''):
+            digest.update(chunk)
+        return digest.hexdigest()
+
+
+def _extract_pdfplumber_pages(pdf_path: str, start: int, stop: int) -> List[Tuple[int, str, List]]:
+    """
+    Extract text and tables from pages [start, stop) with pdfplumber.
+
+    Module-level so it can run in a worker process; each call opens its own
+    handle on the file and only loads the pages in its range.
+
+    Args:
+        pdf_path: Path to PDF file
+        start: First page index (0-based, inclusive)
+        stop: Last page index (0-based, exclusive)
+
+    Returns:
+        List of (page index, text, tables) tuples in page order
+    """
+    results = []
+    with pdfplumber.open(pdf_path, pages=list(range(start + 1, stop + 1))) as pdf:
+        for page in pdf.pages:
+            results.append((page.page_number - 1, page.extract_text() or "",
+                            page.extract_tables()))
+    return results
+
 
 class PDFProcessor:
     """Main PDF processing class with GROBID and fallback support."""
 
-    def __init__(self, grobid_url: str = "http://localhost:8070", base_dir: str = None):
+    def __init__(self, grobid_url: str = "http://localhost:8070", base_dir: str = None,
+                 grobid_workers: int = 4, pdfplumber_workers: Optional[int] = None):
         """
         Initialize PDF processor.
 
         Args:
             grobid_url: URL of GROBID service (if available)
             base_dir: Base directory of the project
+            grobid_workers: PDFs processed concurrently by process_many (match
+                the GROBID server's worker count)
+            pdfplumber_workers: Worker processes for large PDFs in the pdfplumber
+                fallback (default: CPU count; 1 = serial, e.g. when this
+                processor already runs inside a worker pool)
         """
         self.grobid_url = grobid_url
-        self.grobid_available = self._check_grobid()
+        self.grobid_workers = max(1, grobid_workers)
+        self.pdfplumber_workers = pdfplumber_workers
         self.base_dir = Path(base_dir) if base_dir else Path.cwd()
+        self.cache_dir = self.base_dir / EXTRACTION_CACHE_DIR
+
+        # One session for all GROBID calls, so connections are reused across PDFs
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=GROBID_POOL_SIZE, pool_maxsize=GROBID_POOL_SIZE)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+
+    @property
+    def grobid_available(self) -> bool:
+        """
+        Whether the GROBID service is reachable.
+
+        Probed lazily on first use rather than in __init__, so runs that
+        never reach GROBID do not wait on it (see _check_grobid).
+        """
+        return self._check_grobid()
 
     def _check_grobid(self) -> bool:
-        """Check if GROBID service is available."""
+        """
+        Check if GROBID service is available.
+
+        The result is cached per URL for GROBID_CHECK_TTL seconds.
+        """
+        cached = _grobid_status.get(self.grobid_url)
+        now = time.monotonic()
+        if cached is not None and now - cached[0] < GROBID_CHECK_TTL:
+            return cached[1]
+
         try:
-            response = requests.get(f"{self.grobid_url}/api/isalive", timeout=5)
-            return response.status_code == 200
+            response = self.session.get(f"{self.grobid_url}/api/isalive",
+                                        timeout=GROBID_CHECK_TIMEOUT)
+            available = response.status_code == 200
         except:
-            return False
+            available = False
+
+        _grobid_status[self.grobid_url] = (now, available)
+        return available
 
     def generate_paper_id(self, pdf_path: str) -> str:
         """
@@ -78,7 +265,10 @@ class PDFProcessor:
         """
         filename = Path(pdf_path).stem
         # Sanitize filename to create valid ID
-        paper_id = re.sub(r'[^a-zA-Z0-9_-]', '_', filename)
+        if filename.isascii():
+            paper_id = filename.encode('ascii').translate(_PAPER_ID_TABLE).decode('ascii')
+        else:
+            paper_id = _PAPER_ID_RE.sub('_', filename)
         return paper_id[:100]  # Limit length
 
     def extract_with_grobid(self, pdf_path: str) -> Dict:
@@ -96,50 +286,154 @@ class PDFProcessor:
 
         try:
             with open(pdf_path, 'rb') as f:
-                files = {'input': f}
-                # Process full text
-                response = requests.post(
+                if HAS_TOOLBELT:
+                    # Stream the PDF from disk instead of building the body in memory
+                    body = MultipartEncoder(
+                        fields={'input': (Path(pdf_path).name, f, 'application/pdf')}
+                    )
+                    request_args = {'data': body,
+                                    'headers': {'Content-Type': body.content_type}}
+                else:
+                    request_args = {'files': {'input': f}}
+
+                # Process full text; stream the TEI response instead of buffering it
+                response = self.session.post(
+                    f"{self.grobid_url}/api/processFulltextDocument",
+                    stream=True,
+                    timeout=300,
+                    **request_args
+                )
+
+            with response:
+                if response.status_code != 200:
+                    raise Exception(f"GROBID processing failed: {response.status_code}")
+
+                # GROBID returns TEI XML format; parse it as it downloads
+                response.raw.decode_content = True
+                return self._parse_grobid_xml(response.raw)
+
+        except Exception as e:
+            print(f"GROBID extraction failed: {e}")
+            return None
+
+    async def extract_with_grobid_async(self, pdf_path: str, client: "httpx.AsyncClient") -> Dict:
+        """
+        Extract metadata and content using GROBID over an async HTTP/2 client.
+
+        Several of these can share one client, so uploads, server-side
+        processing and TEI downloads for different PDFs overlap on a single
+        multiplexed connection.
+
+        Args:
+            pdf_path: Path to PDF file
+            client: Shared httpx.AsyncClient
+
+        Returns:
+            Dictionary containing extracted data
+        """
+        if not self.grobid_available:
+            raise Exception("GROBID service not available")
+
+        try:
+            with open(pdf_path, 'rb') as f:
+                response = await client.post(
                     f"{self.grobid_url}/api/processFulltextDocument",
-                    files=files,
+                    files={'input': (Path(pdf_path).name, f, 'application/pdf')},
                     timeout=300
                 )
 
-            if response.status_code == 200:
-                # GROBID returns TEI XML format
-                return self._parse_grobid_xml(response.text)
-            else:
+            if response.status_code != 200:
                 raise Exception(f"GROBID processing failed: {response.status_code}")
 
+            # Parse off the event loop so other transfers keep moving
+            return await asyncio.to_thread(self._parse_grobid_xml, io.BytesIO(response.content))
+
         except Exception as e:
             print(f"GROBID extraction failed: {e}")
             return None
 
-    def _parse_grobid_xml(self, xml_content: str) -> Dict:
+    def _parse_grobid_xml(self, xml_source: Union[str, BinaryIO]) -> Dict:
         """
-        Parse GROBID TEI XML output.
+        Parse GROBID TEI XML output incrementally.
+
+        Only the title, authors, abstract and body text are kept; each body
+        section and reference entry is discarded once it has been read, so
+        memory stays bounded by the largest single element.
 
         Args:
-            xml_content: TEI XML string from GROBID
+            xml_source: TEI XML string, or a binary file-like object such as
+                a streamed response body
 
         Returns:
             Dictionary with structured data
         """
-        # Simplified parsing - in production, use proper XML parser
-        # This is a placeholder for the full implementation
+        if isinstance(xml_source, str):
+            xml_source = io.BytesIO(xml_source.encode('utf-8'))
+
+        title = ""
+        authors = []
+        abstract = ""
+        sections = []
+        path = []  # local names of the currently open elements
+
+        for event, elem in ET.iterparse(xml_source, events=('start', 'end')):
+            tag = elem.tag.rsplit('}', 1)[-1]
+            if event == 'start':
+                path.append(tag)
+                continue
+            path.pop()
+
+            if tag == 'title' and not title and 'titleStmt' in path:
+                title = _tei_text(elem)
+
+            elif tag == 'author' and 'analytic' in path and 'teiHeader' in path:
+                pers_name = elem.find(f"{TEI_NS}persName")
+                if pers_name is not None:
+                    # forename(s) and surname are separate child elements
+                    name = " ".join(filter(None, (_tei_text(part) for part in pers_name)))
+                    if name:
+                        authors.append(name)
+
+            elif tag == 'abstract':
+                abstract = _tei_text(elem)
+                elem.clear()
+
+            elif tag == 'div' and 'body' in path:
+                paragraphs = [_tei_text(child) for child in elem
+                              if child.tag in (f"{TEI_NS}head", f"{TEI_NS}p")]
+                section = "\n\n".join(p for p in paragraphs if p)
+                if section:
+                    sections.append(section)
+                elem.clear()
+
+            elif tag == 'biblStruct' and 'back' in path:
+                # References are not used; drop them as they stream past
+                elem.clear()
+
         return {
-            "title": "",
-            "authors": [],
-            "abstract": "",
-            "full_text": xml_content,
+            "title": title,
+            "authors": authors,
+            "abstract": abstract,
+            "full_text": "\n\n".join(sections),
             "method": "grobid"
         }
 
-    def extract_with_pymupdf(self, pdf_path: str) -> Dict:
+    def extract_with_pymupdf(self, pdf_path: str, data: Optional[Union[bytes, mmap.mmap]] = None,
+                             blocks: bool = False) -> Dict:
         """
         Extract text using PyMuPDF (fast, good for most PDFs).
 
+        With blocks=True the result also holds the page's text blocks as
+        parallel lists (block_text, block_bbox, block_page), so downstream
+        filtering of headers, footers or captions can work per block without
+        re-splitting full_text. Both views come from one text page per PDF
+        page, so layout analysis runs only once.
+
         Args:
             pdf_path: Path to PDF file
+            data: PDF bytes already in memory (e.g. from _map_file); the file
+                is opened from pdf_path when omitted
+            blocks: Also return text blocks with bounding boxes
 
         Returns:
             Dictionary containing extracted text and metadata
@@ -147,16 +441,41 @@ class PDFProcessor:
         if not HAS_PYMUPDF:
             raise Exception("PyMuPDF not available")
 
-        doc = fitz.open(pdf_path)
+        doc = None
+        if data is not None:
+            try:
+                doc = fitz.open(stream=memoryview(data), filetype="pdf")
+            except TypeError:
+                # Older PyMuPDF releases accept only bytes as stream; reopening
+                # from the path avoids copying the mapping
+                pass
+        if doc is None:
+            doc = fitz.open(pdf_path)
 
         # Extract metadata
         metadata = doc.metadata
 
-        # Extract text from all pages
-        full_text = ""
-        for page_num, page in enumerate(doc):
-            full_text += f"\n\n--- Page {page_num + 1} ---\n\n"
-            full_text += page.get_text()
+        # Page count is read before the document is closed below
+        page_count = doc.page_count
+
+        # Extract text from all pages (collected in a list and joined once);
+        # sort=False keeps MuPDF's native order and skips the layout sort
+        parts = []
+        block_text, block_bbox, block_page = [], [], []
+        for page_num in range(page_count):
+            page = doc.load_page(page_num)
+            textpage = page.get_textpage(flags=fitz.TEXTFLAGS_TEXT)
+            parts.append(f"\n\n--- Page {page_num + 1} ---\n\n")
+            parts.append(page.get_text("text", sort=False, textpage=textpage))
+            if blocks:
+                # (x0, y0, x1, y1, text, block_no, block_type); type 1 is an image
+                for x0, y0, x1, y1, text, _, block_type in page.get_text(
+                        "blocks", sort=False, textpage=textpage):
+                    if block_type == 0:
+                        block_text.append(text)
+                        block_bbox.append((x0, y0, x1, y1))
+                        block_page.append(page_num)
+        full_text = "".join(parts)
 
         # Try to extract title from first page or metadata
         title = metadata.get('title', '') or self._extract_title_from_text(full_text)
@@ -169,22 +488,41 @@ class PDFProcessor:
 
         doc.close()
 
-        return {
+        result = {
             "title": title,
             "authors": authors,
             "abstract": abstract,
             "full_text": full_text,
             "metadata": metadata,
-            "page_count": len(doc),
+            "page_count": page_count,
             "method": "pymupdf"
         }
+        if blocks:
+            result["block_text"] = block_text
+            result["block_bbox"] = block_bbox
+            result["block_page"] = block_page
+        return result
 
-    def extract_with_pdfplumber(self, pdf_path: str) -> Dict:
+    def _count_pages(self, pdf_path: str) -> int:
+        """Count pages without extracting them (pypdf if available, else pdfplumber)."""
+        if HAS_PYPDF:
+            try:
+                return len(PdfReader(pdf_path).pages)
+            except Exception:
+                pass
+        with pdfplumber.open(pdf_path) as pdf:
+            return len(pdf.pages)
+
+    def extract_with_pdfplumber(self, pdf_path: str, max_workers: Optional[int] = None) -> Dict:
         """
         Extract text using pdfplumber (good for tables and layout).
 
+        pdfplumber is pure Python, so PDFs longer than PDFPLUMBER_CHUNK_PAGES
+        are split into page ranges extracted in parallel worker processes.
+
         Args:
             pdf_path: Path to PDF file
+            max_workers: Worker processes for large PDFs (default: CPU count; 1 = serial)
 
         Returns:
             Dictionary containing extracted text and tables
@@ -192,37 +530,50 @@ class PDFProcessor:
         if not HAS_PDFPLUMBER:
             raise Exception("pdfplumber not available")
 
-        with pdfplumber.open(pdf_path) as pdf:
-            # Extract text
-            full_text = ""
-            tables = []
-
-            for page_num, page in enumerate(pdf.pages):
-                full_text += f"\n\n--- Page {page_num + 1} ---\n\n"
-                full_text += page.extract_text() or ""
-
-                # Extract tables
-                page_tables = page.extract_tables()
-                if page_tables:
-                    tables.extend([{
-                        "page": page_num + 1,
-                        "data": table
-                    } for table in page_tables])
-
-            # Extract title and abstract
-            title = self._extract_title_from_text(full_text)
-            authors = self._extract_authors_from_text(full_text)
-            abstract = self._extract_abstract_from_text(full_text)
+        page_count = self._count_pages(pdf_path)
+        starts = list(range(0, page_count, PDFPLUMBER_CHUNK_PAGES))
+        workers = min(max_workers or os.cpu_count() or 1, len(starts))
+
+        if workers > 1:
+            stops = [min(start + PDFPLUMBER_CHUNK_PAGES, page_count) for start in starts]
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                # map() yields chunks in submission order, so pages stay in order
+                pages = [page for chunk in executor.map(
+                    _extract_pdfplumber_pages, repeat(pdf_path), starts, stops
+                ) for page in chunk]
+        else:
+            pages = _extract_pdfplumber_pages(pdf_path, 0, page_count)
+
+        # Assemble text (collected in a list and joined once) and tables
+        parts = []
+        tables = []
+
+        for page_num, text, page_tables in pages:
+            parts.append(f"\n\n--- Page {page_num + 1} ---\n\n")
+            parts.append(text)
+
+            if page_tables:
+                tables.extend([{
+                    "page": page_num + 1,
+                    "data": table
+                } for table in page_tables])
+
+        full_text = "".join(parts)
+
+        # Extract title and abstract
+        title = self._extract_title_from_text(full_text)
+        authors = self._extract_authors_from_text(full_text)
+        abstract = self._extract_abstract_from_text(full_text)
 
-            return {
-                "title": title,
-                "authors": authors,
-                "abstract": abstract,
-                "full_text": full_text,
-                "tables": tables,
-                "page_count": len(pdf.pages),
-                "method": "pdfplumber"
-            }
+        return {
+            "title": title,
+            "authors": authors,
+            "abstract": abstract,
+            "full_text": full_text,
+            "tables": tables,
+            "page_count": page_count,
+            "method": "pdfplumber"
+        }
 
     def extract_metadata_with_pypdf(self, pdf_path: str) -> Dict:
         """
@@ -252,12 +603,56 @@ class PDFProcessor:
         except:
             return {}
 
+    def extract_pdf_metadata(self, pdf_path: str, result: Optional[Dict] = None) -> Dict:
+        """
+        Extract the PDF info dictionary and page count as cheaply as possible.
+
+        Reuses the metadata PyMuPDF already read when it produced the result;
+        otherwise opens the file with pikepdf (libqpdf) if installed, and
+        falls back to pypdf.
+
+        Args:
+            pdf_path: Path to PDF file
+            result: Extraction result for this PDF, if any
+
+        Returns:
+            Dictionary containing PDF metadata
+        """
+        if result is not None and result.get('method') == 'pymupdf':
+            metadata = result.get('metadata') or {}
+            return {
+                "pdf_title": metadata.get('title', ''),
+                "pdf_author": metadata.get('author', ''),
+                "pdf_subject": metadata.get('subject', ''),
+                "pdf_creator": metadata.get('creator', ''),
+                "pdf_producer": metadata.get('producer', ''),
+                "page_count": result.get('page_count', 0)
+            }
+
+        if HAS_PIKEPDF:
+            try:
+                with pikepdf.open(pdf_path) as pdf:
+                    docinfo = pdf.docinfo
+                    return {
+                        "pdf_title": str(docinfo.get('/Title', '')),
+                        "pdf_author": str(docinfo.get('/Author', '')),
+                        "pdf_subject": str(docinfo.get('/Subject', '')),
+                        "pdf_creator": str(docinfo.get('/Creator', '')),
+                        "pdf_producer": str(docinfo.get('/Producer', '')),
+                        "page_count": len(pdf.pages)
+                    }
+            except Exception:
+                pass
+
+        return self.extract_metadata_with_pypdf(pdf_path)
+
     def _extract_title_from_text(self, text: str) -> str:
         """Extract title from paper text (heuristic approach)."""
-        lines = text.split('\n')
+        # Only the first lines are scanned, so split no further than that
+        lines = _leading_lines(text, TITLE_SCAN_LINES)
         # Title is usually in first few lines, often in larger font
         # Take first substantial line (>10 chars, not starting with numbers)
-        for line in lines[:20]:
+        for line in lines:
             line = line.strip()
             if len(line) > 10 and not line[0].isdigit():
                 return line
@@ -268,9 +663,10 @@ class PDFProcessor:
         # Look for common author patterns after title
         # This is simplified - real implementation would be more sophisticated
         authors = []
-        lines = text.split('\n')
+        # Only the first lines are scanned, so split no further than that
+        lines = _leading_lines(text, AUTHOR_SCAN_LINES)
 
-        for i, line in enumerate(lines[:50]):
+        for i, line in enumerate(lines):
             # Look for patterns like "John Doe, Jane Smith"
             if ',' in line and len(line) < 200:
                 # Simple heuristic: names separated by commas
@@ -285,22 +681,89 @@ class PDFProcessor:
     def _extract_abstract_from_text(self, text: str) -> str:
         """Extract abstract from paper text."""
         # Look for "Abstract" section
-        abstract_match = re.search(
-            r'(?i)abstract[:\s]+(.*?)(?=\n\n|\nintroduction|\n1\.|\nkey)',
-            text,
-            re.DOTALL
-        )
+        abstract_match = _ABSTRACT_RE.search(text)
         if abstract_match:
             return abstract_match.group(1).strip()[:1000]  # Limit length
         return ""
 
-    def process_pdf(self, pdf_path: str, prefer_grobid: bool = True) -> Dict:
+    def _cache_file(self, sha256: str, method: str) -> Path:
+        """Cache path for this PDF hash and extraction method, under the current cache version."""
+        return self.cache_dir / f"{sha256}.{method}.v{EXTRACTION_CACHE_VERSION}.json"
+
+    def _cache_methods(self, prefer_grobid: bool, file_size: float) -> Tuple[str, ...]:
+        """
+        Extraction methods whose cached results may be returned.
+
+        When GROBID would be used for this file and is reachable, only a GROBID
+        result is accepted, so output of the Python fallback cached while
+        GROBID was down is replaced once it is back.
+
+        Args:
+            prefer_grobid: Try GROBID first if available
+            file_size: PDF size in MB
+
+        Returns:
+            Methods in order of preference
+        """
+        if prefer_grobid and file_size > 5 and self.grobid_available:
+            return EXTRACTION_CACHE_METHODS[:1]
+        return EXTRACTION_CACHE_METHODS
+
+    def _load_cached(self, pdf_path: Path, sha256: str,
+                     methods: Tuple[str, ...] = EXTRACTION_CACHE_METHODS) -> Optional[Dict]:
+        """
+        Load a cached extraction result for PDF content, if one exists.
+
+        Args:
+            pdf_path: Path to PDF file (recorded in the returned file_info)
+            sha256: SHA-256 of the PDF bytes
+            methods: Extraction methods to accept, in order of preference
+
+        Returns:
+            Cached result dictionary, or None on a cache miss
+        """
+        for method in methods:
+            try:
+                result = load_json_file(self._cache_file(sha256, method))
+                break
+            except (OSError, ValueError):
+                continue
+        else:
+            return None
+
+        # Same bytes may have been cached under another filename
+        result['file_info']['filename'] = pdf_path.name
+        result['file_info']['path'] = str(pdf_path)
+        return result
+
+    def _store_cached(self, sha256: str, result: Dict):
+        """
+        Write an extraction result to the cache.
+
+        Args:
+            sha256: SHA-256 of the PDF bytes
+            result: Extraction result to cache
+        """
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            write_json_file(self._cache_file(sha256, result['method']), result, indent=False)
+        except OSError as e:
+            print(f"  Warning: could not write extraction cache: {e}")
+
+    def process_pdf(self, pdf_path: str, prefer_grobid: bool = True,
+                    use_cache: bool = True) -> Dict:
         """
         Process PDF with automatic fallback strategy.
 
+        Results are cached under base_dir/.cache keyed by the SHA-256 of the
+        PDF bytes and the extraction method, so unchanged files are not
+        extracted again.
+
         Args:
             pdf_path: Path to PDF file
             prefer_grobid: Try GROBID first if available
+            use_cache: Return a cached result when the PDF is unchanged
+                (pass False to force re-extraction)
 
         Returns:
             Dictionary with extracted data
@@ -315,10 +778,21 @@ class PDFProcessor:
 
         print(f"Processing: {pdf_path.name} ({file_size:.1f} MB)")
 
+        # Map the file once; the hash and PyMuPDF both read from this mapping
+        data = _map_file(pdf_path)
+        sha256 = hashlib.sha256(data).hexdigest()
+        if use_cache:
+            cached = self._load_cached(pdf_path, sha256,
+                                       self._cache_methods(prefer_grobid, file_size))
+            if cached is not None:
+                print("  Using cached extraction")
+                return cached
+
         result = None
 
         # Strategy: Try GROBID for large files if available
-        if prefer_grobid and self.grobid_available and file_size > 5:
+        # (re-probed at most once per GROBID_CHECK_TTL, so a restarted server is noticed)
+        if prefer_grobid and file_size > 5 and self.grobid_available:
             print("  Using GROBID (large file)...")
             try:
                 result = self.extract_with_grobid(str(pdf_path))
@@ -330,23 +804,43 @@ class PDFProcessor:
             if HAS_PYMUPDF:
                 print("  Using PyMuPDF...")
                 try:
-                    result = self.extract_with_pymupdf(str(pdf_path))
+                    result = self.extract_with_pymupdf(str(pdf_path), data)
                 except Exception as e:
                     print(f"  PyMuPDF failed: {e}")
 
             if result is None and HAS_PDFPLUMBER:
                 print("  Using pdfplumber...")
                 try:
-                    result = self.extract_with_pdfplumber(str(pdf_path))
+                    result = self.extract_with_pdfplumber(str(pdf_path),
+                                                          self.pdfplumber_workers)
                 except Exception as e:
                     print(f"  pdfplumber failed: {e}")
 
         if result is None:
             raise Exception("All PDF processing methods failed. Please install required libraries.")
 
-        # Add PDF metadata
-        pdf_metadata = self.extract_metadata_with_pypdf(str(pdf_path))
-        result['pdf_metadata'] = pdf_metadata
+        result = self._add_file_info(result, pdf_path, file_size)
+        self._store_cached(sha256, result)
+        return result
+
+    def _add_file_info(self, result: Dict, pdf_path: Path, file_size: float) -> Dict:
+        """
+        Attach PDF metadata and file information to an extraction result.
+
+        GROBID results already carry the bibliographic metadata, so the PDF
+        info dictionary is not read again for them.
+
+        Args:
+            result: Extraction result from any method
+            pdf_path: Path to PDF file
+            file_size: File size in MB
+
+        Returns:
+            The same result dictionary
+        """
+        # Add PDF metadata (skipped after GROBID, which already parsed the header)
+        if result.get('method') != 'grobid':
+            result['pdf_metadata'] = self.extract_pdf_metadata(str(pdf_path), result)
 
         # Add file info
         result['file_info'] = {
@@ -358,6 +852,114 @@ class PDFProcessor:
 
         return result
 
+    def process_many(self, pdf_paths: Iterable[str], prefer_grobid: bool = True
+                     ) -> Iterator[Tuple[str, Optional[Dict], Optional[Exception]]]:
+        """
+        Process several PDFs concurrently, yielding results as they finish.
+
+        Requests share this processor's pooled session, so up to
+        grobid_workers PDFs are in flight at once and GROBID's server-side
+        workers stay busy instead of waiting on one request at a time.
+
+        Args:
+            pdf_paths: Paths to PDF files
+            prefer_grobid: Try GROBID first if available
+
+        Yields:
+            (pdf_path, result, error) tuples in completion order; result is
+            None and error is set when that PDF failed
+        """
+        with ThreadPoolExecutor(max_workers=self.grobid_workers) as executor:
+            futures = {
+                executor.submit(self.process_pdf, path, prefer_grobid): path
+                for path in pdf_paths
+            }
+            for future in as_completed(futures):
+                path = futures[future]
+                try:
+                    yield path, future.result(), None
+                except Exception as e:
+                    yield path, None, e
+
+    async def process_pdf_async(self, pdf_path: str, client: "httpx.AsyncClient",
+                                prefer_grobid: bool = True) -> Dict:
+        """
+        Process PDF like process_pdf, sending GROBID requests through an async client.
+
+        Uses the same content-hash cache as process_pdf.
+
+        Local extractors are CPU-bound, so the fallback runs process_pdf in a
+        worker thread instead of on the event loop.
+
+        Args:
+            pdf_path: Path to PDF file
+            client: Shared httpx.AsyncClient
+            prefer_grobid: Try GROBID first if available
+
+        Returns:
+            Dictionary with extracted data
+        """
+        pdf_path = Path(pdf_path)
+
+        if not pdf_path.exists():
+            raise FileNotFoundError(f"PDF not found: {pdf_path}")
+
+        file_size = pdf_path.stat().st_size / (1024 * 1024)  # MB
+
+        sha256 = await asyncio.to_thread(_pdf_sha256, pdf_path)
+        methods = await asyncio.to_thread(self._cache_methods, prefer_grobid, file_size)
+        cached = await asyncio.to_thread(self._load_cached, pdf_path, sha256, methods)
+        if cached is not None:
+            return cached
+
+        result = None
+        if prefer_grobid and file_size > 5 and self.grobid_available:
+            print(f"Processing: {pdf_path.name} ({file_size:.1f} MB)")
+            print("  Using GROBID (large file)...")
+            result = await self.extract_with_grobid_async(str(pdf_path), client)
+
+        if result is None:
+            return await asyncio.to_thread(self.process_pdf, str(pdf_path), False, False)
+
+        result = self._add_file_info(result, pdf_path, file_size)
+        await asyncio.to_thread(self._store_cached, sha256, result)
+        return result
+
+    async def process_many_async(self, pdf_paths: Iterable[str], prefer_grobid: bool = True
+                                 ) -> List[Tuple[str, Optional[Dict], Optional[Exception]]]:
+        """
+        Process several PDFs concurrently over one HTTP/2 connection to GROBID.
+
+        At most grobid_workers PDFs are in flight at once.
+
+        Args:
+            pdf_paths: Paths to PDF files
+            prefer_grobid: Try GROBID first if available
+
+        Returns:
+            (pdf_path, result, error) tuples in input order; result is None
+            and error is set when that PDF failed
+        """
+        if not HAS_HTTPX:
+            raise ImportError("httpx not installed. Install with: pip install 'httpx[http2]'")
+
+        if prefer_grobid:
+            # Probe once up front rather than from inside the event loop
+            self._check_grobid()
+
+        semaphore = asyncio.Semaphore(self.grobid_workers)
+
+        async def _process(client, path):
+            async with semaphore:
+                try:
+                    return path, await self.process_pdf_async(path, client, prefer_grobid), None
+                except Exception as e:
+                    return path, None, e
+
+        limits = httpx.Limits(max_connections=GROBID_POOL_SIZE)
+        async with httpx.AsyncClient(http2=True, limits=limits) as client:
+            return await asyncio.gather(*(_process(client, path) for path in pdf_paths))
+
 
 def main():
     """Command-line interface for PDF processing."""
@@ -384,8 +986,7 @@ def main():
 
         # Save full result to JSON
         output_path = Path(pdf_path).stem + "_extracted.json"
-        with open(output_path, 'w', encoding='utf-8') as f:
-            json.dump(result, f, indent=2, ensure_ascii=False)
+        write_json_file(output_path, result, indent=True)
         print(f"\nFull extraction saved to: {output_path}")
 
     except Exception as e:
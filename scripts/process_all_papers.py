@@ -9,6 +9,7 @@ Usage:
     python process_all_papers.py                # Process all pending papers
     python process_all_papers.py --skip-processed  # Skip already processed
     python process_all_papers.py --force-all    # Reprocess all papers
+    python process_all_papers.py --workers 4    # Limit worker processes
 
 Author: Francois (Enhanced 2025-11-04)
 Original: Research Knowledge Base System (2025-10-09)
@@ -17,10 +18,68 @@ Original: Research Knowledge Base System (2025-10-09)
 import os
 import sys
 import argparse
+import traceback
+from itertools import islice, repeat
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 from pathlib import Path
+from typing import Dict, Optional, Tuple
 from process_paper import PaperProcessor
 from processing_status import ProcessingStatusTracker
-from fair_compliance import FAIRComplianceValidator
+from fair_compliance import FAIR_CATEGORIES, FAIRComplianceValidator
+
+
+# Number of FAIR issues kept per paper
+MAX_STATUS_ISSUES = 5
+
+# Threads for the FAIR validation phase, which is mostly small file reads
+FAIR_VALIDATION_THREADS = 16
+
+# Per-process PaperProcessor, created once by _init_worker
+_worker_processor: Optional[PaperProcessor] = None
+
+
+def _init_worker(base_dir: str, verbose: bool = False):
+    """
+    Set up a paper processor per worker process.
+
+    Unless verbose, the worker's step-by-step output is discarded: with
+    several papers in flight it only interleaves on the shared console, and
+    the parent reports each paper as it finishes.
+    """
+    global _worker_processor
+    if not verbose:
+        sys.stdout = open(os.devnull, 'w')
+    # Papers are already spread over worker processes, so pdfplumber's
+    # page-level pool stays serial here rather than nesting another pool
+    _worker_processor = PaperProcessor(base_dir=base_dir, pdfplumber_workers=1)
+
+
+def _process_one(pdf_path: str) -> Dict:
+    """
+    Extract and write one paper inside a worker process.
+
+    master-index.json is left to the parent, which is the only process that
+    writes shared index and status files. Errors (with their traceback text)
+    are returned rather than raised or printed so the parent can record them.
+    """
+    try:
+        return _worker_processor.process_paper(pdf_path, update_index=False)
+    except Exception as e:
+        return {"success": False, "error": str(e), "traceback": traceback.format_exc()}
+
+
+def _validate_one(validator: FAIRComplianceValidator, paper_id: str
+                  ) -> Tuple[str, Optional[Dict], Optional[Exception]]:
+    """
+    Validate one paper's FAIR compliance on a validation thread.
+
+    Errors are returned rather than raised, so one bad paper does not stop
+    the rest of the batch from being validated and recorded.
+    """
+    try:
+        return paper_id, validator.validate_paper(paper_id), None
+    except Exception as e:
+        return paper_id, None, e
 
 
 def main():
@@ -34,6 +93,10 @@ def main():
                        help="Reprocess all papers regardless of status")
     parser.add_argument("--validate-fair", action="store_true", default=True,
                        help="Run FAIR compliance check after processing (default: True)")
+    parser.add_argument("--workers", type=int, default=None,
+                       help="Worker processes for PDF extraction (default: CPU count)")
+    parser.add_argument("--verbose", action="store_true",
+                       help="Show each worker's extraction output and failure tracebacks")
     parser.add_argument("--base-dir", help="Base directory of project",
                        default=None)
 
@@ -49,6 +112,7 @@ def main():
     # Initialize processors
     paper_processor = PaperProcessor(base_dir=str(base_dir))
     status_tracker = ProcessingStatusTracker(base_dir=str(base_dir))
+    # Validation runs after master-index.json is written, so its ids can be cached
     fair_validator = FAIRComplianceValidator(base_dir=str(base_dir))
 
     # Initialize or load status
@@ -79,96 +143,172 @@ def main():
         print("No papers to process!")
         sys.exit(0)
 
+    # List the Literature folder once instead of probing each PDF path
+    with os.scandir(literature_dir) as entries:
+        pdfs_on_disk = {
+            entry.name: entry.path for entry in entries
+            if entry.name.lower().endswith(".pdf")
+        }
+
     # Process each paper
     print("\n" + "=" * 80)
     print("PROCESSING PAPERS")
     print("=" * 80 + "\n")
 
-    results = []
-    for i, paper_entry in enumerate(papers_to_process, 1):
-        pdf_filename = paper_entry["pdf_filename"]
-        paper_id = paper_entry["paper_id"]
-        pdf_path = literature_dir / pdf_filename
-
-        print(f"\n[{i}/{len(papers_to_process)}] Processing: {pdf_filename}")
-        print("-" * 80)
-
-        # Mark as processing
-        status_tracker.mark_processing(paper_id)
-
+    # Papers are extracted in parallel; the parent alone updates the master
+    # index and status, in the order papers finish. The index is kept in
+    # memory and written once after extraction.
+    # Status changes are kept in memory and written every 25 updates (and on
+    # exit) rather than once per mark_* call
+    with status_tracker.batched(flush_every=25):
+        results = []
+        extracted = []
         try:
-            # Process paper
-            result = paper_processor.process_paper(str(pdf_path))
+            with ProcessPoolExecutor(max_workers=args.workers or os.cpu_count(),
+                                     initializer=_init_worker,
+                                     initargs=(str(base_dir), args.verbose)) as executor:
+                futures = {}
+                for paper_entry in papers_to_process:
+                    pdf_filename = paper_entry["pdf_filename"]
+                    pdf_path = pdfs_on_disk.get(pdf_filename)
+                    if pdf_path is None:
+                        print(f"⚠️  Skipping {pdf_filename}: not found in {literature_dir}")
+                        status_tracker.mark_failed(paper_entry["paper_id"], "PDF not found")
+                        results.append({
+                            "pdf_file": pdf_filename,
+                            "paper_id": paper_entry["paper_id"],
+                            "success": False,
+                            "error": "PDF not found"
+                        })
+                        continue
+
+                    # Mark as processing
+                    status_tracker.mark_processing(paper_entry["paper_id"])
+                    futures[executor.submit(_process_one, pdf_path)] = paper_entry
+
+                for i, future in enumerate(as_completed(futures), len(results) + 1):
+                    paper_entry = futures[future]
+                    pdf_filename = paper_entry["pdf_filename"]
+                    paper_id = paper_entry["paper_id"]
+
+                    print(f"\n[{i}/{len(papers_to_process)}] Finished: {pdf_filename}")
+                    print("-" * 80)
+
+                    try:
+                        result = future.result()
+                        if not result["success"]:
+                            if args.verbose and result.get("traceback"):
+                                print(result["traceback"], file=sys.stderr)
+                            raise Exception(result.get("error", "Unknown error"))
+
+                        paper_processor.update_master_index(result["metadata"], flush=False)
+                        extracted.append((pdf_filename, paper_id, result))
+
+                    except Exception as e:
+                        print(f"\n✗ Failed to process {pdf_filename}: {e}")
+
+                        # Mark as failed
+                        status_tracker.mark_failed(paper_id, str(e))
+
+                        results.append({
+                            "pdf_file": pdf_filename,
+                            "paper_id": paper_id,
+                            "success": False,
+                            "error": str(e)
+                        })
+        finally:
+            paper_processor.flush_indices()
+
+        # Validate FAIR compliance against the updated master index. This runs
+        # once extraction has drained, on threads since it is I/O-bound.
+        fair_results = [(paper_id, None, None) for _, paper_id, _ in extracted]
+        if args.validate_fair and extracted:
+            print(f"\nValidating FAIR compliance for {len(extracted)} papers...")
+            with ThreadPoolExecutor(max_workers=FAIR_VALIDATION_THREADS) as pool:
+                fair_results = list(pool.map(_validate_one, repeat(fair_validator),
+                                             [paper_id for _, paper_id, _ in extracted]))
+
+        for (pdf_filename, paper_id, result), (_, fair_result, error) in zip(extracted, fair_results):
+            if error is not None:
+                print(f"\n✗ FAIR validation failed for {pdf_filename}: {error}")
+
+                # Mark as failed
+                status_tracker.mark_failed(paper_id, str(error))
+
+                results.append({
+                    "pdf_file": pdf_filename,
+                    "paper_id": paper_id,
+                    "success": False,
+                    "error": str(error)
+                })
+                continue
 
-            # Validate FAIR compliance if requested
             fair_score = None
-            if args.validate_fair and result["success"]:
-                print(f"\nValidating FAIR compliance for {paper_id}...")
-                fair_result = fair_validator.validate_paper(paper_id)
+            if fair_result is not None:
                 fair_score = fair_result.get("score", 0)
-                print(f"  FAIR Score: {fair_score}/100")
+                print(f"  {paper_id}: FAIR Score {fair_score}/100")
 
-                # Collect issues
-                issues = []
-                for category in ["findable", "accessible", "interoperable", "reusable"]:
-                    if category in fair_result:
-                        issues.extend(fair_result[category].get("issues", []))
+                # Collect the first few issues, stopping once enough are found
+                issues = list(islice(
+                    (issue for category in FAIR_CATEGORIES
+                     for issue in fair_result.get(category, {}).get("issues", ())),
+                    MAX_STATUS_ISSUES
+                ))
 
                 # Mark as completed with FAIR score
-                status_tracker.mark_completed(paper_id, fair_score, issues[:5])  # Top 5 issues
+                status_tracker.mark_completed(paper_id, fair_score, issues)
             else:
                 status_tracker.mark_completed(paper_id)
 
             result["fair_score"] = fair_score
             results.append(result)
 
-        except Exception as e:
-            print(f"\n✗ Failed to process {pdf_filename}: {e}")
-            import traceback
-            traceback.print_exc()
-
-            # Mark as failed
-            status_tracker.mark_failed(paper_id, str(e))
-
-            results.append({
-                "pdf_file": pdf_filename,
-                "paper_id": paper_id,
-                "success": False,
-                "error": str(e)
-            })
-
     # Final summary
     print("\n" + "=" * 80)
     print("BATCH PROCESSING SUMMARY")
     print("=" * 80)
 
-    successful = sum(1 for r in results if r.get("success", False))
-    failed = len(results) - successful
+    # Partition results and bucket FAIR scores in a single pass
+    successful = 0
+    failures = []
+    fair_scores = []
+    low_scorers = []
+    excellent = good = 0
+    for r in results:
+        if not r.get("success", False):
+            failures.append(r)
+            continue
+        successful += 1
+        score = r.get("fair_score")
+        if score is None:
+            continue
+        fair_scores.append(score)
+        if score >= 90:
+            excellent += 1
+        elif score >= 70:
+            good += 1
+        else:
+            low_scorers.append(r)
+    failed = len(failures)
 
     print(f"\nTotal Processed: {len(results)}")
     print(f"  Successful: {successful} ({successful/len(results)*100:.1f}%)")
     print(f"  Failed: {failed} ({failed/len(results)*100:.1f}%)")
 
     # FAIR score summary
-    fair_scores = [r.get("fair_score") for r in results if r.get("fair_score") is not None]
     if fair_scores:
         avg_fair = sum(fair_scores) / len(fair_scores)
         print(f"\nFAIR Compliance:")
         print(f"  Average Score: {avg_fair:.1f}/100")
         print(f"  Range: {min(fair_scores):.1f} - {max(fair_scores):.1f}")
 
-        excellent = sum(1 for s in fair_scores if s >= 90)
-        good = sum(1 for s in fair_scores if 70 <= s < 90)
-        needs_work = sum(1 for s in fair_scores if s < 70)
-
         print(f"  Excellent (≥90): {excellent}")
         print(f"  Good (70-89): {good}")
-        print(f"  Needs Work (<70): {needs_work}")
+        print(f"  Needs Work (<70): {len(low_scorers)}")
 
     print("=" * 80)
 
     # List failures
-    failures = [r for r in results if not r.get("success", False)]
     if failures:
         print("\nFailed Papers:")
         for fail in failures:
@@ -176,13 +316,10 @@ def main():
             print(f"    Error: {fail.get('error', 'Unknown error')}")
 
     # Show papers needing attention
-    if fair_scores:
-        low_scorers = [r for r in results
-                      if r.get("fair_score", 100) < 70 and r.get("success")]
-        if low_scorers:
-            print("\nPapers Needing Attention (FAIR < 70):")
-            for paper in low_scorers:
-                print(f"  - {paper['paper_id']}: {paper['fair_score']}/100")
+    if low_scorers:
+        print("\nPapers Needing Attention (FAIR < 70):")
+        for paper in low_scorers:
+            print(f"  - {paper['paper_id']}: {paper['fair_score']}/100")
 
     print("\n✓ Processing complete!")
     print(f"\nNext steps:")
@@ -12,42 +12,156 @@ Date: 2025-10-09
 """
 
 import os
+import re
 import sys
-import json
 import shutil
+import traceback
 from pathlib import Path
 from datetime import datetime
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 import argparse
 
 # Import our PDF processor
 from pdf_processor import PDFProcessor
+from json_io import dump_json, load_json_file
+
+# DOI patterns in priority order, compiled once; the first that matches wins
+# ("doi:" also covers "DOI:" since matching ignores case)
+DOI_PATTERNS = tuple(re.compile(pattern, re.IGNORECASE) for pattern in (
+    r'doi:\s*(10\.\d{4,}/[^\s]+)',
+    r'https?://doi\.org/(10\.\d{4,}/[^\s]+)',
+    r'\b(10\.\d{4,}/[^\s]+)\b'
+))
+
+# Leading characters of the text searched for a DOI
+DOI_SCAN_CHARS = 5000
+
+# Placeholders filled in by generate_context_md / generate_annotations_md
+CONTEXT_PLACEHOLDERS = ("[Title]", "[DOI or unique ID]", "[Full title]",
+                        "[Author list with ORCIDs if available]", "[ISO 8601 format]")
+ANNOTATIONS_PLACEHOLDERS = ("[Paper Title]", "[Unique identifier]", "[Date]", "[User]")
+
+# Used when TEMPLATE_context.md is missing
+FALLBACK_CONTEXT_TEMPLATE = "# Paper Context: [Title]\n\n[Template not found]"
+
+
+def _write_if_changed(path: Path, data: bytes) -> bool:
+    """
+    Atomically write data to path unless the file already holds it.
+
+    The new content goes to a temporary file that is renamed over path, so
+    an interrupted run never leaves a truncated file. An unchanged file is
+    left untouched, keeping its mtime (and any cache keyed on it) valid.
+
+    Args:
+        path: File to write
+        data: Content to write
+
+    Returns:
+        True if the file was written, False if it was already up to date
+    """
+    try:
+        if os.path.getsize(path) == len(data):
+            with open(path, 'rb') as f:
+                if f.read() == data:
+                    return False
+    except OSError:
+        pass
+
+    tmp_path = path.with_name(path.name + ".tmp")
+    with open(tmp_path, 'wb') as f:
+        f.write(data)
+    os.replace(tmp_path, path)
+    return True
+
+
+def _split_template(template: str, placeholders: Tuple[str, ...]) -> List[str]:
+    """
+    Split a template into alternating literal text and placeholders.
+
+    Odd indices of the returned list hold placeholders; filling the
+    template is then one join with no rescans of the text.
+
+    Args:
+        template: Template text
+        placeholders: Placeholder strings to split on
+
+    Returns:
+        List of template parts
+    """
+    pattern = "(" + "|".join(map(re.escape, placeholders)) + ")"
+    return re.split(pattern, template)
+
+
+def _fill_template(parts: List[str], values: Dict[str, str]) -> str:
+    """
+    Fill a template split by _split_template in a single pass.
+
+    Args:
+        parts: Template parts from _split_template
+        values: Replacement text for each placeholder
+
+    Returns:
+        Filled-in template
+    """
+    filled = parts.copy()
+    filled[1::2] = [values[placeholder] for placeholder in parts[1::2]]
+    return "".join(filled)
 
 
 class PaperProcessor:
     """Process academic papers into FAIR-compliant knowledge base entries."""
 
-    def __init__(self, base_dir: str = None):
-        """Initialize the paper processor."""
+    def __init__(self, base_dir: str = None, pdfplumber_workers: Optional[int] = None):
+        """
+        Initialize the paper processor.
+
+        Args:
+            base_dir: Base directory of the project
+            pdfplumber_workers: Passed to PDFProcessor (1 = no page-level pool)
+        """
         self.base_dir = Path(base_dir) if base_dir else Path.cwd()
         self.kb_dir = self.base_dir / "knowledge-base"
         self.papers_dir = self.kb_dir / "papers"
         self.index_dir = self.kb_dir / "index"
-        self.pdf_processor = PDFProcessor(base_dir=base_dir)
+        self.pdf_processor = PDFProcessor(base_dir=base_dir,
+                                          pdfplumber_workers=pdfplumber_workers)
+
+        # Templates are read and split once, then reused for every paper
+        context_template = self._read_template("TEMPLATE_context.md")
+        self._context_parts = _split_template(context_template or FALLBACK_CONTEXT_TEMPLATE,
+                                              CONTEXT_PLACEHOLDERS)
+        annotations_template = self._read_template("TEMPLATE_annotations.md")
+        self._annotations_parts = (
+            _split_template(annotations_template, ANNOTATIONS_PLACEHOLDERS)
+            if annotations_template is not None else None
+        )
+
+        # master-index.json held in memory between flush_indices() calls
+        self._master_index: Optional[Dict] = None
+        self._papers_by_id: Optional[Dict[str, Dict]] = None
+        self._master_index_dirty = False
+
+    def _read_template(self, template_name: str) -> Optional[str]:
+        """Read a template from the papers directory, or None if it does not exist."""
+        try:
+            with open(self.papers_dir / template_name, 'r', encoding='utf-8') as f:
+                return f.read()
+        except FileNotFoundError:
+            return None
 
     def load_index(self, index_name: str) -> Dict:
         """Load an index file."""
         index_path = self.index_dir / f"{index_name}.json"
         if index_path.exists():
-            with open(index_path, 'r', encoding='utf-8') as f:
-                return json.load(f)
+            return load_json_file(index_path)
         return {}
 
     def save_index(self, index_name: str, data: Dict):
         """Save an index file."""
         index_path = self.index_dir / f"{index_name}.json"
-        with open(index_path, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
+        with open(index_path, 'wb') as f:
+            f.write(dump_json(data, indent=True))
 
     def create_paper_directory(self, paper_id: str) -> Path:
         """Create directory structure for a paper."""
@@ -59,17 +173,9 @@ class PaperProcessor:
 
     def extract_doi_from_text(self, text: str) -> Optional[str]:
         """Try to extract DOI from paper text."""
-        import re
-        # Common DOI patterns
-        patterns = [
-            r'doi:\s*(10\.\d{4,}/[^\s]+)',
-            r'DOI:\s*(10\.\d{4,}/[^\s]+)',
-            r'https?://doi\.org/(10\.\d{4,}/[^\s]+)',
-            r'\b(10\.\d{4,}/[^\s]+)\b'
-        ]
-
-        for pattern in patterns:
-            match = re.search(pattern, text[:5000], re.IGNORECASE)  # Search first 5000 chars
+        for pattern in DOI_PATTERNS:
+            # endpos bounds the search without copying the prefix
+            match = pattern.search(text, 0, DOI_SCAN_CHARS)
             if match:
                 doi = match.group(1)
                 # Clean up DOI
@@ -83,6 +189,8 @@ class PaperProcessor:
         if not doi and pdf_data.get('full_text'):
             doi = self.extract_doi_from_text(pdf_data['full_text'])
 
+        # Built as a fresh literal per call: cheaper than deep-copying a template
+        now = datetime.now().isoformat()
         metadata = {
             "paper_id": paper_id,
             "doi": doi or "",
@@ -98,8 +206,8 @@ class PaperProcessor:
             },
             "keywords": [],  # To be filled by user
             "abstract": pdf_data.get('abstract', ''),
-            "date_added": datetime.now().isoformat(),
-            "last_modified": datetime.now().isoformat(),
+            "date_added": now,
+            "last_modified": now,
             "access": {
                 "license": "Unknown",
                 "access_level": "restricted",
@@ -131,22 +239,43 @@ class PaperProcessor:
 
         return metadata
 
-    def generate_context_md(self, metadata: Dict, pdf_data: Dict) -> str:
-        """Generate context.md file from metadata and PDF data."""
-        template_path = self.papers_dir / "TEMPLATE_context.md"
+    def _keep_unchanged_timestamps(self, metadata: Dict, metadata_file: Path):
+        """
+        Reuse the timestamps of an existing metadata.json with the same content.
 
-        if template_path.exists():
-            with open(template_path, 'r', encoding='utf-8') as f:
-                template = f.read()
-        else:
-            template = "# Paper Context: [Title]\n\n[Template not found]"
+        generate_metadata() stamps date_added/last_modified with the current
+        time; when nothing else differs from the file on disk, the old stamps
+        are kept so re-processing leaves metadata.json (and context.md)
+        byte-for-byte unchanged.
 
+        Args:
+            metadata: Freshly generated metadata, updated in place
+            metadata_file: Existing metadata.json for the paper
+        """
+        try:
+            existing = load_json_file(metadata_file)
+        except (OSError, ValueError):
+            return
+        if not isinstance(existing, dict):
+            return
+
+        stamps = ("date_added", "last_modified")
+        if all(k in existing for k in stamps) and \
+                {k: v for k, v in existing.items() if k not in stamps} == \
+                {k: v for k, v in metadata.items() if k not in stamps}:
+            for key in stamps:
+                metadata[key] = existing[key]
+
+    def generate_context_md(self, metadata: Dict, pdf_data: Dict) -> str:
+        """Generate context.md file from metadata and PDF data."""
         # Fill in template with available data
-        context = template.replace("[Title]", metadata.get('title', 'Unknown Title'))
-        context = context.replace("[DOI or unique ID]", metadata.get('doi', metadata.get('paper_id', '')))
-        context = context.replace("[Full title]", metadata.get('title', ''))
-        context = context.replace("[Author list with ORCIDs if available]", ', '.join(metadata.get('authors', [])))
-        context = context.replace("[ISO 8601 format]", metadata.get('date_added', ''))
+        context = _fill_template(self._context_parts, {
+            "[Title]": metadata.get('title', 'Unknown Title'),
+            "[DOI or unique ID]": metadata.get('doi', metadata.get('paper_id', '')),
+            "[Full title]": metadata.get('title', ''),
+            "[Author list with ORCIDs if available]": ', '.join(metadata.get('authors', [])),
+            "[ISO 8601 format]": metadata.get('date_added', '')
+        })
 
         # Add abstract if available
         abstract = metadata.get('abstract', '')
@@ -157,28 +286,32 @@ class PaperProcessor:
 
     def generate_annotations_md(self, metadata: Dict) -> str:
         """Generate annotations.md file."""
-        template_path = self.papers_dir / "TEMPLATE_annotations.md"
-
-        if template_path.exists():
-            with open(template_path, 'r', encoding='utf-8') as f:
-                template = f.read()
-
+        if self._annotations_parts is not None:
             # Fill in template
-            annotations = template.replace("[Paper Title]", metadata.get('title', 'Unknown Title'))
-            annotations = annotations.replace("[Unique identifier]", metadata.get('paper_id', ''))
-            annotations = annotations.replace("[Date]", datetime.now().strftime("%Y-%m-%d"))
-            annotations = annotations.replace("[User]", "System")
-
-            return annotations
+            return _fill_template(self._annotations_parts, {
+                "[Paper Title]": metadata.get('title', 'Unknown Title'),
+                "[Unique identifier]": metadata.get('paper_id', ''),
+                "[Date]": datetime.now().strftime("%Y-%m-%d"),
+                "[User]": "System"
+            })
         else:
             return f"# Annotations: {metadata.get('title', 'Unknown Title')}\n\n[Template not found]"
 
-    def update_master_index(self, metadata: Dict):
-        """Update the master index with new paper."""
-        master_index = self.load_index("master-index")
+    def update_master_index(self, metadata: Dict, flush: bool = True):
+        """
+        Update the master index with new paper.
+
+        The index is loaded once and kept in memory, keyed by paper_id, so
+        batch callers can pass flush=False for each paper and call
+        flush_indices() once at the end.
 
-        if "papers" not in master_index:
-            master_index["papers"] = []
+        Args:
+            metadata: Paper metadata
+            flush: Write master-index.json immediately
+        """
+        if self._papers_by_id is None:
+            self._master_index = self.load_index("master-index")
+            self._papers_by_id = {p["paper_id"]: p for p in self._master_index.get("papers", [])}
 
         # Add paper entry
         paper_entry = {
@@ -191,22 +324,25 @@ class PaperProcessor:
             "file_path": f"knowledge-base/papers/{metadata['paper_id']}"
         }
 
-        # Check if paper already exists
-        existing = [p for p in master_index["papers"] if p["paper_id"] == metadata["paper_id"]]
-        if existing:
-            # Update existing entry
-            master_index["papers"] = [p if p["paper_id"] != metadata["paper_id"] else paper_entry
-                                      for p in master_index["papers"]]
-        else:
-            # Add new entry
-            master_index["papers"].append(paper_entry)
+        # An existing entry is replaced in place; new papers are appended
+        self._papers_by_id[metadata["paper_id"]] = paper_entry
+
+        self._master_index["last_updated"] = datetime.now().isoformat()
+        self._master_index_dirty = True
 
-        master_index["last_updated"] = datetime.now().isoformat()
+        if flush:
+            self.flush_indices()
 
-        self.save_index("master-index", master_index)
+    def flush_indices(self):
+        """Write the in-memory master index to master-index.json if it changed."""
+        if not self._master_index_dirty:
+            return
+        self._master_index["papers"] = list(self._papers_by_id.values())
+        self.save_index("master-index", self._master_index)
+        self._master_index_dirty = False
 
     def process_paper(self, pdf_path: str, doi: Optional[str] = None,
-                     paper_id: Optional[str] = None) -> Dict:
+                     paper_id: Optional[str] = None, update_index: bool = True) -> Dict:
         """
         Process a paper through the complete pipeline.
 
@@ -214,6 +350,8 @@ class PaperProcessor:
             pdf_path: Path to PDF file
             doi: Optional DOI
             paper_id: Optional custom paper ID
+            update_index: Add the paper to master-index.json (batch workers
+                pass False and leave the index update to the parent process)
 
         Returns:
             Dictionary with processing results
@@ -238,6 +376,7 @@ class PaperProcessor:
         # Step 4: Generate metadata
         print("Step 4: Generating metadata...")
         metadata = self.generate_metadata(pdf_data, paper_id, doi)
+        self._keep_unchanged_timestamps(metadata, paper_dir / "metadata.json")
 
         # Step 5: Generate context file
         print("Step 5: Generating context file...")
@@ -249,8 +388,7 @@ class PaperProcessor:
 
         # Step 7: Save all files
         print("Step 7: Saving files...")
-        with open(paper_dir / "metadata.json", 'w', encoding='utf-8') as f:
-            json.dump(metadata, f, indent=2, ensure_ascii=False)
+        _write_if_changed(paper_dir / "metadata.json", dump_json(metadata, indent=True))
 
         with open(paper_dir / "context.md", 'w', encoding='utf-8') as f:
             f.write(context_md)
@@ -258,13 +396,14 @@ class PaperProcessor:
         with open(paper_dir / "annotations.md", 'w', encoding='utf-8') as f:
             f.write(annotations_md)
 
-        # Save full extracted text for reference
-        with open(paper_dir / "full_text.txt", 'w', encoding='utf-8') as f:
-            f.write(pdf_data.get('full_text', ''))
+        # Save full extracted text for reference (skipped when unchanged)
+        _write_if_changed(paper_dir / "full_text.txt",
+                          pdf_data.get('full_text', '').encode('utf-8'))
 
         # Step 8: Update indices
-        print("Step 8: Updating indices...")
-        self.update_master_index(metadata)
+        if update_index:
+            print("Step 8: Updating indices...")
+            self.update_master_index(metadata)
 
         print(f"\n{'='*80}")
         print(f"✓ Successfully processed: {metadata.get('title', 'Unknown Title')}")
@@ -306,7 +445,6 @@ def main():
 
     except Exception as e:
         print(f"\n✗ Error processing paper: {e}")
-        import traceback
         traceback.print_exc()
         sys.exit(1)
 
@@ -3,25 +3,82 @@
 Processing Status Tracker
 
 This script tracks which papers have been processed and their quality status.
-Maintains processing_status.json with current state of all PDFs.
+Maintains processing_status.json with current state of all PDFs. Individual
+updates between full rewrites are appended to processing_status.log.jsonl.
 
 Usage:
     python processing_status.py --init           # Initialize status from Literature/
+    python processing_status.py --init --rescan  # Initialize even if folders are unchanged
     python processing_status.py --list-pending   # Show unprocessed papers
     python processing_status.py --report         # Generate summary report
     python processing_status.py --mark-processed <paper_id> --score <score>
     python processing_status.py --mark-failed <paper_id> --error "<error_msg>"
+    python processing_status.py --mark-batch <updates.jsonl>
 
 Author: Francois
 Date: 2025-11-04
 """
 
-import json
+import os
 import sys
-import argparse
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from pathlib import Path
 from datetime import datetime
-from typing import Dict, List, Optional
+from types import SimpleNamespace
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+try:
+    import ijson
+    HAS_IJSON = True
+except ImportError:
+    HAS_IJSON = False
+
+from json_io import dump_json_line, load_json_file, parse_json, write_json_file
+
+
+def _read_status_header(f) -> Dict:
+    """
+    Read the top-level scalar fields of a status file with ijson.
+
+    Parsing stops at the "papers" key, so the papers list is not read.
+    """
+    header = {}
+    for prefix, event, value in ijson.parse(f, use_float=True):
+        if event == 'map_key' and prefix == '' and value == 'papers':
+            break
+        if prefix and '.' not in prefix and event in ('string', 'number', 'boolean', 'null'):
+            header[prefix] = value
+    return header
+
+
+# Top-level fields generate_report needs before it reaches the papers
+STATUS_HEADER_KEYS = frozenset({"last_updated", "total_pdfs", "processed", "pending"})
+
+# Status log lines after which the snapshot is rewritten and the log cleared
+STATUS_LOG_COMPACT_LINES = 1000
+
+# paper_id sanitizer (spaces to underscores, parentheses dropped), applied in one pass
+_PAPER_ID_TABLE = str.maketrans({' ': '_', '(': None, ')': None})
+
+# Threads used to read processed papers' metadata.json during --init
+METADATA_READ_THREADS = 16
+
+
+def _read_date_added(metadata_file: Path) -> Tuple[Optional[str], Optional[str]]:
+    """
+    Read date_added from a paper's metadata.json.
+
+    Returns:
+        (date_added, error message); both None if the file does not exist
+    """
+    try:
+        return load_json_file(metadata_file).get("date_added"), None
+    except FileNotFoundError:
+        return None, None
+    except Exception as e:
+        return None, f"Failed to read metadata: {e}"
 
 
 class ProcessingStatusTracker:
@@ -34,25 +91,71 @@ class ProcessingStatusTracker:
         self.papers_dir = self.base_dir / "knowledge-base" / "papers"
         self.index_dir = self.base_dir / "knowledge-base" / "index"
         self.status_file = self.index_dir / "processing_status.json"
+        # Entries changed since processing_status.json was written, one per line
+        self.status_log_file = self.index_dir / "processing_status.log.jsonl"
+        # While batching (see batched()): the in-memory status, saves since the
+        # last flush, changed entries not yet logged, and whether anything changed
+        self._batch_status: Optional[Dict] = None
+        self._flush_every = 1
+        self._unsaved_changes = 0
+        self._unlogged: Dict[str, Dict] = {}
+        self._batch_dirty = False
+        # Last status read or written, the (mtime, size) stamps of the snapshot
+        # and log at that point, and the number of lines in the log
+        self._status_cache: Optional[Dict] = None
+        self._status_stamp: Optional[Tuple] = None
+        self._log_lines = 0
+        # paper_id -> entry for the status dict it was built from
+        self._index_status: Optional[Dict] = None
+        self._papers_by_id: Dict[str, Dict] = {}
+
+    def _scan_stamp(self) -> Optional[Dict[str, int]]:
+        """Return the mtimes of Literature/ and the papers folder, or None if either is missing."""
+        try:
+            return {
+                "literature_mtime": os.stat(self.literature_dir).st_mtime_ns,
+                "papers_mtime": os.stat(self.papers_dir).st_mtime_ns
+            }
+        except FileNotFoundError:
+            return None
 
-    def initialize_status(self) -> Dict:
+    def initialize_status(self, rescan: bool = False) -> Dict:
         """
         Initialize processing status by scanning Literature/ folder.
         Returns status dictionary.
+
+        If neither Literature/ nor the papers folder has gained or lost
+        entries since the status file was built (same directory mtimes), the
+        existing status is returned without rewriting the file, unless rescan
+        is set.
         """
+        scan_stamp = self._scan_stamp()
+        if not rescan and scan_stamp is not None and self._status_file_stamp() is not None:
+            existing = self.load_status()
+            if existing.get("scan_cache") == scan_stamp:
+                print("✓ Literature/ and papers unchanged since last scan; kept processing_status.json")
+                return existing
+
         print("Scanning Literature/ folder...")
 
-        # Find all PDFs
-        pdf_files = sorted(self.literature_dir.glob("*.pdf"))
+        # Find all PDFs (file names only; no Path objects are needed)
+        pdf_files = []
+        if self.literature_dir.exists():
+            with os.scandir(self.literature_dir) as entries:
+                pdf_files = sorted(
+                    entry.name for entry in entries
+                    if entry.name.endswith(".pdf") and entry.is_file()
+                )
         print(f"Found {len(pdf_files)} PDF files")
 
         # Load existing processed papers
         processed_papers = set()
         if self.papers_dir.exists():
-            processed_papers = {
-                d.name for d in self.papers_dir.iterdir()
-                if d.is_dir() and not d.name.startswith('TEMPLATE')
-            }
+            with os.scandir(self.papers_dir) as entries:
+                processed_papers = {
+                    entry.name for entry in entries
+                    if entry.is_dir() and not entry.name.startswith('TEMPLATE')
+                }
         print(f"Found {len(processed_papers)} already processed papers")
 
         # Create status entries
@@ -62,13 +165,14 @@ class ProcessingStatusTracker:
             "total_pdfs": len(pdf_files),
             "processed": len(processed_papers),
             "pending": len(pdf_files) - len(processed_papers),
+            "scan_cache": scan_stamp,
             "papers": []
         }
 
-        for pdf_path in pdf_files:
-            pdf_filename = pdf_path.name
+        processed_entries = []
+        for pdf_filename in pdf_files:
             # Generate paper_id same way as process_paper.py
-            paper_id = pdf_path.stem.replace(' ', '_').replace('(', '').replace(')', '')
+            paper_id = pdf_filename[:-len(".pdf")].translate(_PAPER_ID_TABLE)
 
             # Check if processed
             is_processed = paper_id in processed_papers
@@ -82,23 +186,26 @@ class ProcessingStatusTracker:
                 "issues": []
             }
 
-            # If processed, try to get date from metadata
             if is_processed:
-                metadata_file = self.papers_dir / paper_id / "metadata.json"
-                if metadata_file.exists():
-                    try:
-                        with open(metadata_file, 'r') as f:
-                            metadata = json.load(f)
-                            entry["date_processed"] = metadata.get("date_added")
-                    except Exception as e:
-                        entry["issues"].append(f"Failed to read metadata: {e}")
+                processed_entries.append(entry)
 
             status["papers"].append(entry)
 
+        # For processed papers, take the date from metadata; the small reads
+        # are overlapped on a thread pool
+        if processed_entries:
+            metadata_files = [self.papers_dir / entry["paper_id"] / "metadata.json"
+                              for entry in processed_entries]
+            with ThreadPoolExecutor(max_workers=METADATA_READ_THREADS) as pool:
+                for entry, (date_added, error) in zip(
+                        processed_entries, pool.map(_read_date_added, metadata_files)):
+                    entry["date_processed"] = date_added
+                    if error:
+                        entry["issues"].append(error)
+
         # Save status file
         self.index_dir.mkdir(parents=True, exist_ok=True)
-        with open(self.status_file, 'w') as f:
-            json.dump(status, f, indent=2, ensure_ascii=False)
+        self._write_status(status)
 
         print(f"\n✓ Initialized processing_status.json")
         print(f"  Total PDFs: {status['total_pdfs']}")
@@ -107,35 +214,251 @@ class ProcessingStatusTracker:
 
         return status
 
+    @staticmethod
+    def _file_stamp(path: Path) -> Optional[Tuple[int, int]]:
+        """Return (mtime_ns, size) of path, or None if it is missing."""
+        try:
+            st = os.stat(path)
+        except FileNotFoundError:
+            return None
+        return st.st_mtime_ns, st.st_size
+
+    def _status_file_stamp(self) -> Optional[Tuple]:
+        """Return the stamps of processing_status.json and its log, or None if the former is missing."""
+        snapshot = self._file_stamp(self.status_file)
+        if snapshot is None:
+            return None
+        return snapshot, self._file_stamp(self.status_log_file)
+
     def load_status(self) -> Dict:
-        """Load current processing status."""
-        if not self.status_file.exists():
+        """
+        Load current processing status.
+
+        processing_status.json is read and the changes in the status log are
+        applied on top. The result is cached and returned as-is (callers
+        mutate it in place) until either file is changed by another process.
+        """
+        if self._batch_status is not None:
+            return self._batch_status
+
+        stamp = self._status_file_stamp()
+        if stamp is None:
             print("Warning: processing_status.json not found. Run --init first.")
             return None
 
-        with open(self.status_file, 'r') as f:
-            return json.load(f)
+        if stamp != self._status_stamp:
+            status = load_json_file(self.status_file)
+            self._log_lines = self._replay_log(status)
+            self._status_cache = status
+            self._status_stamp = stamp
+        return self._status_cache
 
-    def save_status(self, status: Dict):
-        """Save processing status."""
-        status["last_updated"] = datetime.now().isoformat()
-        with open(self.status_file, 'w') as f:
-            json.dump(status, f, indent=2, ensure_ascii=False)
+    def _status_for_reading(self) -> Tuple[Optional[Dict], Iterable[Dict]]:
+        """
+        Return the top-level status fields and the paper entries, read-only.
+
+        With ijson installed, and processing_status.json neither cached nor
+        waiting on a status log replay, the entries are parsed incrementally
+        as they are iterated, so the papers list is never held in memory.
+        Otherwise this is load_status() and its papers list.
+        """
+        if (HAS_IJSON and self._batch_status is None and self._status_cache is None
+                and self._file_stamp(self.status_log_file) is None):
+            try:
+                with open(self.status_file, 'rb') as f:
+                    header = _read_status_header(f)
+            except FileNotFoundError:
+                header = None
+            if header is not None and STATUS_HEADER_KEYS <= header.keys():
+                return header, self._iter_snapshot_papers()
+
+        status = self.load_status()
+        if not status:
+            return None, ()
+        return status, status["papers"]
+
+    def _iter_snapshot_papers(self) -> Iterator[Dict]:
+        """Yield the paper entries of processing_status.json one at a time (requires ijson)."""
+        with open(self.status_file, 'rb') as f:
+            yield from ijson.items(f, 'papers.item', use_float=True)
+
+    def _replay_log(self, status: Dict) -> int:
+        """
+        Apply the entries in the status log to status, in order.
+
+        Returns:
+            Number of log lines applied
+        """
+        try:
+            f = open(self.status_log_file, 'rb')
+        except FileNotFoundError:
+            return 0
+
+        papers_by_id = {p["paper_id"]: p for p in status["papers"]}
+        lines = 0
+        with f:
+            for line in f:
+                if not line.strip():
+                    continue
+                try:
+                    change = parse_json(line)
+                except ValueError:
+                    # Torn last line from an interrupted append
+                    break
+                lines += 1
+                paper = papers_by_id.get(change.get("paper_id"))
+                if paper is not None:
+                    paper.update(change)
+                    status["last_updated"] = change.get("date_processed") or status["last_updated"]
+
+        if lines:
+            self._update_counts(status)
+        return lines
+
+    def _find_paper(self, status: Dict, paper_id: str) -> Optional[Dict]:
+        """
+        Look up a paper entry by id.
+
+        The id index is built once per status dict and reused while
+        load_status() keeps returning the same (cached) dict.
+        """
+        if self._index_status is not status:
+            self._papers_by_id = {p["paper_id"]: p for p in status["papers"]}
+            self._index_status = status
+        return self._papers_by_id.get(paper_id)
+
+    @staticmethod
+    def _already_completed(paper: Dict, fair_score: Optional[float],
+                           issues: Optional[List[str]]) -> bool:
+        """True if marking paper completed with this score and issues would change nothing."""
+        return (paper["status"] == "completed"
+                and (fair_score is None or paper["fair_compliance_score"] == fair_score)
+                and (not issues or paper["issues"] == issues))
+
+    @staticmethod
+    def _update_counts(status: Dict):
+        """Recompute the processed/pending totals in a single pass."""
+        counts = Counter(p["status"] for p in status["papers"])
+        status["processed"] = counts["completed"]
+        status["pending"] = counts["pending"]
+
+    def save_status(self, status: Dict, changed: Optional[List[Dict]] = None,
+                    now: Optional[str] = None):
+        """
+        Save processing status.
+
+        Given the changed entries, only those are appended to the status log;
+        the full snapshot is written instead once the log reaches
+        STATUS_LOG_COMPACT_LINES lines, or when changed is not given. An
+        empty changed list saves nothing.
+
+        While batching, changes are held in memory and logged every
+        flush_every saves; commit() writes the snapshot at the end.
+
+        now, if given, is the ISO timestamp the caller already took for
+        these changes and is reused for last_updated.
+        """
+        if changed is not None and not changed:
+            return
+
+        status["last_updated"] = now or datetime.now().isoformat()
+        if self._batch_status is not None:
+            for paper in changed or ():
+                self._unlogged[paper["paper_id"]] = paper
+            self._batch_dirty = True
+            self._unsaved_changes += 1
+            if self._unsaved_changes >= self._flush_every:
+                self._append_log(list(self._unlogged.values()))
+                self._unlogged.clear()
+                self._unsaved_changes = 0
+            return
+
+        if changed is None or self._log_lines + len(changed) >= STATUS_LOG_COMPACT_LINES:
+            self._write_status(status)
+        else:
+            self._append_log(changed)
+
+    def _append_log(self, entries: List[Dict]):
+        """Append entries to the status log with a single write."""
+        if not entries:
+            return
+        data = b"".join(dump_json_line(entry) for entry in entries)
+        with open(self.status_log_file, 'ab') as f:
+            f.write(data)
+        self._log_lines += len(entries)
+        self._status_stamp = self._status_file_stamp()
+
+    def _write_status(self, status: Dict):
+        """Write status to processing_status.json, clear the status log and cache the status."""
+        write_json_file(self.status_file, status)
+        # Entries replayed twice after a crash between these steps are harmless
+        self.status_log_file.unlink(missing_ok=True)
+        self._log_lines = 0
+        self._status_cache = status
+        self._status_stamp = self._status_file_stamp()
+        self._unsaved_changes = 0
+
+    def compact(self):
+        """Fold the status log into processing_status.json."""
+        status = self.load_status()
+        if status and self._log_lines:
+            self._write_status(status)
+
+    def begin_batch(self, flush_every: int = 25):
+        """
+        Start batching status updates.
+
+        The status is loaded once and kept in memory; mark_* calls update it
+        there and the changed entries are logged every flush_every changes.
+        Call commit() to write the snapshot and end the batch.
+
+        Args:
+            flush_every: Number of status changes between log writes
+        """
+        self._batch_status = self.load_status()
+        self._flush_every = max(1, flush_every)
+        self._unsaved_changes = 0
+        self._unlogged.clear()
+        self._batch_dirty = False
+
+    def commit(self):
+        """Write processing_status.json if the batch changed anything, and end the batch."""
+        if self._batch_status is not None and self._batch_dirty:
+            self._write_status(self._batch_status)
+        self._unlogged.clear()
+        self._batch_dirty = False
+        self._batch_status = None
+
+    @contextmanager
+    def batched(self, flush_every: int = 25):
+        """
+        Context manager around begin_batch()/commit().
+
+        Changes are committed on exit, including when an exception is raised,
+        so at most flush_every updates are lost if the process is killed.
+        """
+        self.begin_batch(flush_every)
+        try:
+            yield self
+        finally:
+            self.commit()
 
     def list_pending(self) -> List[Dict]:
         """List all pending papers."""
-        status = self.load_status()
+        status, papers = self._status_for_reading()
         if not status:
             return []
 
-        pending = [p for p in status["papers"] if p["status"] == "pending"]
+        pending = [p for p in papers if p["status"] == "pending"]
 
-        print(f"\nPending Papers ({len(pending)}):")
-        print("=" * 80)
-        for i, paper in enumerate(pending, 1):
-            print(f"{i:3d}. {paper['pdf_filename']}")
-            print(f"     Paper ID: {paper['paper_id']}")
-        print("=" * 80)
+        # Built up and written in one go rather than two print() calls per paper
+        lines = [f"\nPending Papers ({len(pending)}):", "=" * 80]
+        lines.extend(
+            f"{i:3d}. {paper['pdf_filename']}\n     Paper ID: {paper['paper_id']}"
+            for i, paper in enumerate(pending, 1)
+        )
+        lines.append("=" * 80)
+        sys.stdout.write("\n".join(lines) + "\n")
 
         return pending
 
@@ -145,13 +468,18 @@ class ProcessingStatusTracker:
         if not status:
             return False
 
-        for paper in status["papers"]:
-            if paper["paper_id"] == paper_id:
-                paper["status"] = "processing"
-                paper["date_processed"] = datetime.now().isoformat()
-                break
+        now = datetime.now().isoformat()
+        paper = self._find_paper(status, paper_id)
+        if paper is None:
+            return True
+
+        paper["status"] = "processing"
+        paper["date_processed"] = now
+
+        # Update counts
+        self._update_counts(status)
 
-        self.save_status(status)
+        self.save_status(status, [paper], now)
         return True
 
     def mark_completed(self, paper_id: str, fair_score: Optional[float] = None,
@@ -161,21 +489,23 @@ class ProcessingStatusTracker:
         if not status:
             return False
 
-        for paper in status["papers"]:
-            if paper["paper_id"] == paper_id:
-                paper["status"] = "completed"
-                paper["date_processed"] = datetime.now().isoformat()
-                if fair_score is not None:
-                    paper["fair_compliance_score"] = fair_score
-                if issues:
-                    paper["issues"] = issues
-                break
+        now = datetime.now().isoformat()
+        paper = self._find_paper(status, paper_id)
+        # Re-marking a completed paper with the same results is a no-op
+        if paper is None or self._already_completed(paper, fair_score, issues):
+            return True
+
+        paper["status"] = "completed"
+        paper["date_processed"] = now
+        if fair_score is not None:
+            paper["fair_compliance_score"] = fair_score
+        if issues:
+            paper["issues"] = issues
 
         # Update counts
-        status["processed"] = sum(1 for p in status["papers"] if p["status"] == "completed")
-        status["pending"] = sum(1 for p in status["papers"] if p["status"] == "pending")
+        self._update_counts(status)
 
-        self.save_status(status)
+        self.save_status(status, [paper], now)
         return True
 
     def mark_failed(self, paper_id: str, error: str):
@@ -184,75 +514,193 @@ class ProcessingStatusTracker:
         if not status:
             return False
 
-        for paper in status["papers"]:
-            if paper["paper_id"] == paper_id:
-                paper["status"] = "failed"
-                paper["date_processed"] = datetime.now().isoformat()
-                paper["issues"].append(f"Processing failed: {error}")
-                break
+        now = datetime.now().isoformat()
+        paper = self._find_paper(status, paper_id)
+        if paper is None:
+            return True
+
+        paper["status"] = "failed"
+        paper["date_processed"] = now
+        paper["issues"].append(f"Processing failed: {error}")
+
+        # Update counts
+        self._update_counts(status)
+
+        self.save_status(status, [paper], now)
+        return True
+
+    def mark_many(self, updates: List[Tuple[str, str, Optional[float], Optional[List[str]]]]):
+        """
+        Apply several status updates and save once.
+
+        Args:
+            updates: (paper_id, status, fair_score, issues) tuples, where status
+                is "processing", "completed" or "failed". Completed updates
+                set the score and issues like mark_completed; for failed
+                updates, issues are the error messages recorded by mark_failed.
+                Unknown paper_ids are ignored.
+        """
+        status = self.load_status()
+        if not status:
+            return False
+
+        now = datetime.now().isoformat()
+        changed = []
+        for paper_id, new_status, fair_score, issues in updates:
+            if new_status not in ("processing", "completed", "failed"):
+                raise ValueError(f"Unknown status for {paper_id}: {new_status}")
+            paper = self._find_paper(status, paper_id)
+            if paper is None or (new_status == "completed"
+                                 and self._already_completed(paper, fair_score, issues)):
+                continue
+
+            paper["status"] = new_status
+            paper["date_processed"] = now
+            changed.append(paper)
+            if new_status == "completed":
+                if fair_score is not None:
+                    paper["fair_compliance_score"] = fair_score
+                if issues:
+                    paper["issues"] = issues
+            elif new_status == "failed":
+                paper["issues"].extend(f"Processing failed: {error}" for error in issues or ())
+
+        if not changed:
+            return True
+
+        # Update counts
+        self._update_counts(status)
 
-        self.save_status(status)
+        self.save_status(status, changed, now)
         return True
 
     def generate_report(self):
         """Generate summary report of processing status."""
-        status = self.load_status()
+        status, papers = self._status_for_reading()
         if not status:
             return
 
-        print("\n" + "=" * 80)
-        print("PROCESSING STATUS REPORT")
-        print("=" * 80)
-        print(f"Last Updated: {status['last_updated']}")
-        print(f"\nTotal PDFs:   {status['total_pdfs']}")
-        print(f"Processed:    {status['processed']} ({status['processed']/status['total_pdfs']*100:.1f}%)")
-        print(f"Pending:      {status['pending']} ({status['pending']/status['total_pdfs']*100:.1f}%)")
+        # Gather every tally in one pass over the papers
+        status_counts = Counter()
+        score_count = 0
+        score_sum = 0.0
+        score_min = score_max = None
+        excellent = good = needs_work = 0
+        issue_count = 0
+        papers_with_issues = []
+        for p in papers:
+            paper_status = p["status"]
+            status_counts[paper_status] += 1
+            if p["issues"]:
+                issue_count += 1
+                if len(papers_with_issues) < 5:  # Show first 5
+                    papers_with_issues.append(p)
+            score = p["fair_compliance_score"]
+            if paper_status != "completed" or score is None:
+                continue
+            score_count += 1
+            score_sum += score
+            if score_min is None or score < score_min:
+                score_min = score
+            if score_max is None or score > score_max:
+                score_max = score
+            if score >= 90:
+                excellent += 1
+            elif score >= 70:
+                good += 1
+            else:
+                needs_work += 1
+
+        # Report lines are collected and written with a single write
+        lines = []
+        lines.append("\n" + "=" * 80)
+        lines.append("PROCESSING STATUS REPORT")
+        lines.append("=" * 80)
+        lines.append(f"Last Updated: {status['last_updated']}")
+        lines.append(f"\nTotal PDFs:   {status['total_pdfs']}")
+        lines.append(f"Processed:    {status['processed']} ({status['processed']/status['total_pdfs']*100:.1f}%)")
+        lines.append(f"Pending:      {status['pending']} ({status['pending']/status['total_pdfs']*100:.1f}%)")
 
         # Count by status
-        failed = sum(1 for p in status["papers"] if p["status"] == "failed")
-        processing = sum(1 for p in status["papers"] if p["status"] == "processing")
+        failed = status_counts["failed"]
+        processing = status_counts["processing"]
         if failed > 0:
-            print(f"Failed:       {failed}")
+            lines.append(f"Failed:       {failed}")
         if processing > 0:
-            print(f"Processing:   {processing}")
+            lines.append(f"Processing:   {processing}")
 
         # FAIR compliance summary
-        completed_papers = [p for p in status["papers"]
-                           if p["status"] == "completed" and p["fair_compliance_score"] is not None]
-        if completed_papers:
-            scores = [p["fair_compliance_score"] for p in completed_papers]
-            avg_score = sum(scores) / len(scores)
-            print(f"\nFAIR Compliance (n={len(scores)}):")
-            print(f"  Average: {avg_score:.1f}/100")
-            print(f"  Range: {min(scores):.1f} - {max(scores):.1f}")
+        if score_count:
+            avg_score = score_sum / score_count
+            lines.append(f"\nFAIR Compliance (n={score_count}):")
+            lines.append(f"  Average: {avg_score:.1f}/100")
+            lines.append(f"  Range: {score_min:.1f} - {score_max:.1f}")
 
             # Quality breakdown
-            excellent = sum(1 for s in scores if s >= 90)
-            good = sum(1 for s in scores if 70 <= s < 90)
-            needs_work = sum(1 for s in scores if s < 70)
-            print(f"  Excellent (≥90): {excellent}")
-            print(f"  Good (70-89): {good}")
-            print(f"  Needs Work (<70): {needs_work}")
+            lines.append(f"  Excellent (≥90): {excellent}")
+            lines.append(f"  Good (70-89): {good}")
+            lines.append(f"  Needs Work (<70): {needs_work}")
 
         # Papers with issues
-        papers_with_issues = [p for p in status["papers"] if p["issues"]]
         if papers_with_issues:
-            print(f"\nPapers with Issues: {len(papers_with_issues)}")
-            for paper in papers_with_issues[:5]:  # Show first 5
-                print(f"  - {paper['paper_id']}")
+            lines.append(f"\nPapers with Issues: {issue_count}")
+            for paper in papers_with_issues:
+                lines.append(f"  - {paper['paper_id']}")
                 for issue in paper['issues'][:2]:  # Show first 2 issues
-                    print(f"    • {issue}")
+                    lines.append(f"    • {issue}")
 
-        print("=" * 80 + "\n")
+        lines.append("=" * 80 + "\n")
+        sys.stdout.write("\n".join(lines) + "\n")
 
 
-def main():
-    """Command-line interface."""
+# Default project directory for the command-line interface
+DEFAULT_BASE_DIR = "/Users/clarice/Desktop/Claude test"
+
+# Options accepted by the argparse-free fast path for single status updates
+_FAST_PATH_OPTIONS = {"--mark-processed": "mark_processed", "--mark-failed": "mark_failed",
+                      "--score": "score", "--error": "error", "--base-dir": "base_dir"}
+
+
+def _parse_mark_args(argv: List[str]) -> Optional[SimpleNamespace]:
+    """
+    Parse a single --mark-processed / --mark-failed invocation without argparse.
+
+    Scripts that call this once per paper mostly pay for interpreter and
+    argparse startup, so these simple forms skip building the parser. Anything
+    else (other options, --opt=value, a bad --score) returns None and is left
+    to argparse, which also produces the usual errors.
+    """
+    if not argv or argv[0] not in ("--mark-processed", "--mark-failed") or len(argv) % 2:
+        return None
+
+    args = SimpleNamespace(init=False, rescan=False, list_pending=False, report=False,
+                           mark_processed=None, mark_failed=None, mark_batch=None,
+                           score=None, error=None, base_dir=DEFAULT_BASE_DIR)
+    for option, value in zip(argv[::2], argv[1::2]):
+        dest = _FAST_PATH_OPTIONS.get(option)
+        if dest is None or value.startswith("--"):
+            return None
+        setattr(args, dest, value)
+
+    if args.score is not None:
+        try:
+            args.score = float(args.score)
+        except ValueError:
+            return None
+    return args
+
+
+def _build_parser():
+    """Build the argparse parser for the command-line interface."""
+    import argparse
+
     parser = argparse.ArgumentParser(
         description="Track processing status of papers in knowledge base"
     )
     parser.add_argument("--init", action="store_true",
                        help="Initialize status from Literature/ folder")
+    parser.add_argument("--rescan", action="store_true",
+                       help="With --init, rescan even if the folders look unchanged")
     parser.add_argument("--list-pending", action="store_true",
                        help="List all pending papers")
     parser.add_argument("--report", action="store_true",
@@ -261,24 +709,40 @@ def main():
                        help="Mark paper as successfully processed")
     parser.add_argument("--mark-failed", metavar="PAPER_ID",
                        help="Mark paper as failed")
+    parser.add_argument("--mark-batch", metavar="FILE",
+                       help="Apply status updates from a JSONL file, one object per line "
+                            "with paper_id, status and optional score, issues or error")
     parser.add_argument("--score", type=float,
                        help="FAIR compliance score (0-100)")
     parser.add_argument("--error", help="Error message for failed paper")
     parser.add_argument("--base-dir", help="Base directory of project",
-                       default="/Users/clarice/Desktop/Claude test")
+                       default=DEFAULT_BASE_DIR)
+    return parser
+
 
-    args = parser.parse_args()
+def main():
+    """Command-line interface."""
+    # The fast path only accepts mark commands, so the help branch below
+    # is always reached with a parser
+    parser = None
+    args = _parse_mark_args(sys.argv[1:])
+    if args is None:
+        parser = _build_parser()
+        args = parser.parse_args()
 
     tracker = ProcessingStatusTracker(base_dir=args.base_dir)
 
     if args.init:
-        tracker.initialize_status()
+        tracker.initialize_status(rescan=args.rescan)
     elif args.list_pending:
         tracker.list_pending()
     elif args.report:
         tracker.generate_report()
     elif args.mark_processed:
-        success = tracker.mark_completed(args.mark_processed, args.score)
+        # Single updates from the command line go straight into the snapshot
+        # (via the batch commit) rather than the status log
+        with tracker.batched():
+            success = tracker.mark_completed(args.mark_processed, args.score)
         if success:
             print(f"✓ Marked {args.mark_processed} as completed")
         else:
@@ -287,11 +751,30 @@ def main():
         if not args.error:
             print("Error: --error required when marking as failed")
             sys.exit(1)
-        success = tracker.mark_failed(args.mark_failed, args.error)
+        with tracker.batched():
+            success = tracker.mark_failed(args.mark_failed, args.error)
         if success:
             print(f"✓ Marked {args.mark_failed} as failed")
         else:
             print(f"✗ Failed to update status")
+    elif args.mark_batch:
+        updates = []
+        with open(args.mark_batch, 'rb') as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                update = parse_json(line)
+                issues = update.get("issues")
+                if update.get("error"):
+                    issues = [update["error"]]
+                updates.append((update["paper_id"], update["status"],
+                                update.get("score"), issues))
+        with tracker.batched():
+            success = tracker.mark_many(updates)
+        if success:
+            print(f"✓ Applied {len(updates)} status updates")
+        else:
+            print("✗ Failed to update status")
     else:
         parser.print_help()
 